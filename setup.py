@@ -13,5 +13,8 @@ setup(
         'Operating System :: OS Independent',
         'Intended Audience :: Science/Research'
     ],
-    install_requires=open('requirements.txt').readlines()
+    install_requires=open('requirements.txt').readlines(),
+    extras_require={
+        'full': ['aiohttp', 'orjson']
+    }
 )
@@ -0,0 +1,447 @@
+import json
+import re
+import threading
+import time
+import unittest
+from unittest.mock import Mock, patch
+import requests
+from zen.api import _APIRequest, _RateLimiter, _ResponseCache, APIResponseError, Depositions, \
+    LicensesPage
+
+
+def make_response(status_code=200, body=None, headers=None):
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = json.dumps(body if body is not None else {}).encode()
+    response.headers.update(headers or {})
+    return response
+
+def make_request(*responses):
+    session = Mock(spec=requests.Session)
+    session.request.side_effect = list(responses)
+    return _APIRequest(session=session, rate_limit=None), session
+
+class TestResponseCache(unittest.TestCase):
+    url = 'https://example.com/api/records/1'
+
+    def test_revalidate_with_etag(self):
+        request, session = make_request(
+            make_response(200, {'id': 1}, {'ETag': '"abc"'}),
+            make_response(304, None, {'ETag': '"abc"'})
+        )
+        first = request.get(self.url)
+        second = request.get(self.url)
+        self.assertIs(second, first)
+        self.assertEqual(second.json(), {'id': 1})
+        headers = session.request.call_args.kwargs['headers']
+        self.assertEqual(headers['If-None-Match'], '"abc"')
+
+    def test_revalidate_with_last_modified(self):
+        date = 'Wed, 21 Oct 2015 07:28:00 GMT'
+        request, session = make_request(
+            make_response(200, {'id': 1}, {'Last-Modified': date}),
+            make_response(304)
+        )
+        request.get(self.url)
+        self.assertEqual(request.get(self.url).json(), {'id': 1})
+        headers = session.request.call_args.kwargs['headers']
+        self.assertEqual(headers['If-Modified-Since'], date)
+
+    def test_modified_response_replaces_stored_one(self):
+        request, session = make_request(
+            make_response(200, {'id': 1}, {'ETag': '"v1"'}),
+            make_response(200, {'id': 2}, {'ETag': '"v2"'}),
+            make_response(304)
+        )
+        request.get(self.url)
+        self.assertEqual(request.get(self.url).json(), {'id': 2})
+        self.assertEqual(request.get(self.url).json(), {'id': 2})
+        headers = session.request.call_args.kwargs['headers']
+        self.assertEqual(headers['If-None-Match'], '"v2"')
+
+    def test_max_age_skips_request(self):
+        request, session = make_request(
+            make_response(200, {'id': 1}, {'Cache-Control': 'max-age=600'})
+        )
+        request.get(self.url)
+        self.assertEqual(request.get(self.url).json(), {'id': 1})
+        self.assertEqual(session.request.call_count, 1)
+
+    def test_no_store_is_not_stored(self):
+        request, session = make_request(
+            make_response(200, {'id': 1}, {'Cache-Control': 'no-store', 'ETag': '"abc"'}),
+            make_response(200, {'id': 1})
+        )
+        request.get(self.url)
+        request.get(self.url)
+        self.assertEqual(session.request.call_count, 2)
+        headers = session.request.call_args.kwargs['headers']
+        self.assertNotIn('If-None-Match', headers or {})
+
+    def test_responses_without_validators_are_not_stored(self):
+        request, session = make_request(make_response(200, {'id': 1}), make_response(200))
+        request.get(self.url)
+        request.get(self.url)
+        self.assertEqual(session.request.call_count, 2)
+
+    def test_key_includes_headers(self):
+        request, session = make_request(
+            make_response(200, {'id': 1}, {'Cache-Control': 'max-age=600'}),
+            make_response(200, {'id': 1}, {'Cache-Control': 'max-age=600'})
+        )
+        request.get(self.url)
+        request.get(self.url, headers={'Accept': 'application/xml'})
+        self.assertEqual(session.request.call_count, 2)
+
+    def test_unsafe_request_invalidates_url_and_parents(self):
+        request, session = make_request(
+            make_response(200, {'id': 1}, {'Cache-Control': 'max-age=600'}),
+            make_response(200, [], {'Cache-Control': 'max-age=600'}),
+            make_response(200, {'id': 1}),
+            make_response(200, {'id': 2}),
+            make_response(200, [{'id': 2}])
+        )
+        request.get(self.url)
+        request.get('https://example.com/api/records')
+        request.put(self.url)
+        self.assertEqual(request.get(self.url).json(), {'id': 2})
+        self.assertEqual(request.get('https://example.com/api/records').json(), [{'id': 2}])
+        self.assertEqual(session.request.call_count, 5)
+
+    def test_max_age_directives(self):
+        self.assertEqual(_ResponseCache.max_age({'Cache-Control': 'max-age=60'}), 60)
+        self.assertEqual(_ResponseCache.max_age({'Cache-Control': 'no-cache, max-age=60'}), 0)
+        self.assertIsNone(_ResponseCache.max_age({'Cache-Control': 'no-store'}))
+        self.assertEqual(_ResponseCache.max_age({}), 0)
+
+    def test_lru_eviction(self):
+        cache = _ResponseCache(maxsize=2)
+        response = make_response(200, None, {'ETag': '"abc"'})
+        for url in ('a', 'b', 'c'):
+            cache.set(_ResponseCache.key(url, None), response)
+        self.assertIsNone(cache.get(_ResponseCache.key('a', None))[0])
+        self.assertIs(cache.get(_ResponseCache.key('c', None))[0], response)
+
+class TestAPIResponseError(unittest.TestCase):
+    def test_description_with_field_errors(self):
+        body = {'message': 'Validation error.', 
+                'errors': [{'field': 'title', 'message': 'Required.'}]}
+        error = APIResponseError(make_response(400, body))
+        self.assertEqual(error.description, "Validation error. Field 'title'. Required.")
+
+    def test_description_with_errors_object(self):
+        body = {'message': 'Validation error.', 'errors': {'field': 'title'}}
+        error = APIResponseError(make_response(400, body))
+        self.assertEqual(error.description, 'Validation error.')
+
+    def test_description_without_json_body(self):
+        response = make_response(404)
+        response._content = b'Not Found'
+        error = APIResponseError(response)
+        self.assertEqual(error.description, APIResponseError.bad_status_codes[404]['description'])
+
+class TestInflightRequests(unittest.TestCase):
+    url = 'https://example.com/api/records/1'
+
+    def _concurrent_gets(self, request, session, responses, waiters=3, **kwargs):
+        # The first request blocks in the session until the other ones have been issued
+        entered = threading.Event()
+        release = threading.Event()
+        def send(*args, **kw):
+            entered.set()
+            release.wait(5)
+            response = responses.pop(0)
+            if isinstance(response, Exception):
+                raise response
+            return response
+        session.request.side_effect = send
+        results = []
+        def get():
+            try:
+                results.append(request.get(self.url, **kwargs))
+            except Exception as e:
+                results.append(e)
+        threads = [threading.Thread(target=get)]
+        threads[0].start()
+        entered.wait(5)
+        threads += [threading.Thread(target=get) for _ in range(waiters)]
+        for thread in threads[1:]:
+            thread.start()
+        time.sleep(0.2)
+        release.set()
+        for thread in threads:
+            thread.join(5)
+        return results
+
+    def test_identical_gets_share_one_request(self):
+        request, session = make_request()
+        results = self._concurrent_gets(request, session, [make_response(200, {'id': 1})])
+        self.assertEqual(session.request.call_count, 1)
+        self.assertEqual(len(results), 4)
+        self.assertTrue(all(result is results[0] for result in results))
+
+    def test_errors_are_shared_with_waiters(self):
+        request, session = make_request()
+        results = self._concurrent_gets(request, session, [make_response(404)])
+        self.assertEqual(session.request.call_count, 1)
+        self.assertTrue(all(isinstance(result, APIResponseError) for result in results))
+
+    def test_request_is_sent_again_once_completed(self):
+        request, session = make_request(make_response(200, {'id': 1}), make_response(200, {'id': 2}))
+        request.get(self.url)
+        self.assertEqual(request.get(self.url).json(), {'id': 2})
+        self.assertEqual(session.request.call_count, 2)
+
+    def test_different_params_are_not_shared(self):
+        request, session = make_request(make_response(200), make_response(200))
+        request.get(self.url, params={'page': 1})
+        request.get(self.url, params={'page': 2})
+        self.assertEqual(session.request.call_count, 2)
+
+    def test_streamed_and_unsafe_requests_are_not_coalesced(self):
+        self.assertIsNone(_APIRequest._inflight_key('GET', self.url, None, None, {'stream': True}))
+        self.assertIsNone(_APIRequest._inflight_key('POST', self.url, None, None, {}))
+        self.assertIsNotNone(_APIRequest._inflight_key('GET', self.url, None, None, {}))
+
+class TestSharedAdapters(unittest.TestCase):
+    key = (7, 1)
+
+    def make_request(self):
+        return _APIRequest(rate_limit=None, pool_size=self.key[0], max_retries=self.key[1])
+
+    def test_sessions_share_adapter(self):
+        first, second = self.make_request(), self.make_request()
+        self.assertIs(first._session.get_adapter('https://example.com'), 
+                      second._session.get_adapter('https://example.com'))
+        first.close()
+        second.close()
+
+    def test_adapter_is_closed_by_last_owner(self):
+        first, second = self.make_request(), self.make_request()
+        adapter = _APIRequest._adapters[self.key]
+        with patch.object(adapter, 'close') as close_mock:
+            first.close()
+            first.close()
+            close_mock.assert_not_called()
+            self.assertIs(_APIRequest._adapters[self.key], adapter)
+            second.close()
+            close_mock.assert_called_once()
+        self.assertNotIn(self.key, _APIRequest._adapters)
+        third = self.make_request()
+        self.assertIsNot(third._session.get_adapter('https://example.com'), adapter)
+        third.close()
+
+    def test_provided_session_is_left_open(self):
+        request, session = make_request()
+        request.close()
+        session.close.assert_not_called()
+
+class TestRateLimiter(unittest.TestCase):
+    @patch('zen.api.time.monotonic')
+    def test_reserve_waits_when_bucket_is_empty(self, monotonic_mock):
+        monotonic_mock.return_value = 100.0
+        limiter = _RateLimiter(2, 60)
+        self.assertEqual(limiter._reserve(), 0)
+        self.assertEqual(limiter._reserve(), 0)
+        self.assertAlmostEqual(limiter._reserve(), 30)
+        self.assertAlmostEqual(limiter._reserve(), 60)
+
+    @patch('zen.api.time.monotonic')
+    def test_reserve_refills_bucket_over_time(self, monotonic_mock):
+        monotonic_mock.return_value = 100.0
+        limiter = _RateLimiter(2, 60)
+        limiter._reserve()
+        limiter._reserve()
+        monotonic_mock.return_value = 130.0
+        self.assertEqual(limiter._reserve(), 0)
+        # The bucket never holds more than `max_rate` tokens
+        monotonic_mock.return_value = 1000.0
+        self.assertEqual(limiter._reserve(), 0)
+        self.assertEqual(limiter._reserve(), 0)
+        self.assertAlmostEqual(limiter._reserve(), 30)
+
+    @patch('zen.api.time.time')
+    @patch('zen.api.time.monotonic')
+    def test_update_blocks_until_reset(self, monotonic_mock, time_mock):
+        monotonic_mock.return_value = 100.0
+        time_mock.return_value = 5000.0
+        limiter = _RateLimiter(100, 60)
+        limiter.update({'X-RateLimit-Remaining': '2', 'X-RateLimit-Reset': '5010'})
+        self.assertAlmostEqual(limiter._reserve(), 10)
+
+    @patch('zen.api.time.time')
+    @patch('zen.api.time.monotonic')
+    def test_update_wait_is_bounded_by_time_period(self, monotonic_mock, time_mock):
+        monotonic_mock.return_value = 100.0
+        time_mock.return_value = 5000.0
+        limiter = _RateLimiter(100, 60)
+        limiter.update({'X-RateLimit-Remaining': '0', 'X-RateLimit-Reset': '9000'})
+        self.assertAlmostEqual(limiter._reserve(), 60)
+
+    @patch('zen.api.time.monotonic')
+    def test_update_ignores_missing_or_invalid_headers(self, monotonic_mock):
+        monotonic_mock.return_value = 100.0
+        limiter = _RateLimiter(100, 60)
+        limiter.update({})
+        limiter.update({'X-RateLimit-Remaining': 'x', 'X-RateLimit-Reset': '1'})
+        limiter.update({'X-RateLimit-Remaining': '50', 'X-RateLimit-Reset': str(time.time() + 10)})
+        self.assertEqual(limiter._reserve(), 0)
+
+    @patch('zen.api.time.sleep')
+    @patch('zen.api.time.monotonic')
+    def test_acquire_sleeps_only_when_needed(self, monotonic_mock, sleep_mock):
+        monotonic_mock.return_value = 100.0
+        limiter = _RateLimiter(1, 60)
+        limiter.acquire()
+        sleep_mock.assert_not_called()
+        limiter.acquire()
+        sleep_mock.assert_called_once()
+        self.assertAlmostEqual(sleep_mock.call_args.args[0], 60)
+
+    def test_invalid_max_rate(self):
+        with self.assertRaises(ValueError):
+            _RateLimiter(0)
+
+class TestDepositionsPagination(unittest.TestCase):
+    def make_depositions(self, total, default_size=10, max_size=1000):
+        # Serves `total` depositions in pages, capping the page size as the server does
+        def list_depositions(query):
+            size = min(query.get('size', default_size), max_size)
+            start = (query.get('page', 1) - 1) * size
+            return [{'id': i, 'files': []} for i in range(start, min(start + size, total))]
+        api = Mock()
+        api.api.list_depositions.side_effect = list_depositions
+        return Depositions(api), api.api.list_depositions
+
+    def test_list_all_depositions(self):
+        depositions, list_mock = self.make_depositions(23)
+        result = depositions.list()
+        self.assertEqual([dep.id for dep in result], list(range(23)))
+        self.assertEqual(list_mock.call_count, 4)
+
+    def test_list_single_page(self):
+        depositions, list_mock = self.make_depositions(7)
+        self.assertEqual(len(depositions.list()), 7)
+        self.assertEqual(list_mock.call_count, 2)
+
+    def test_list_empty(self):
+        depositions, list_mock = self.make_depositions(0)
+        self.assertEqual(depositions.list(), [])
+        self.assertEqual(list_mock.call_count, 1)
+
+    def test_list_with_page_size_capped_by_server(self):
+        depositions, _ = self.make_depositions(23, max_size=10)
+        self.assertEqual(len(depositions.list(size=50)), 23)
+
+    def test_list_many_pages_in_order(self):
+        depositions, _ = self.make_depositions(205)
+        result = depositions.list(max_workers=4)
+        self.assertEqual([dep.id for dep in result], list(range(205)))
+
+    def test_iter_requests_pages_on_demand(self):
+        depositions, list_mock = self.make_depositions(23)
+        iterator = depositions.iter()
+        self.assertEqual(next(iterator).id, 0)
+        self.assertEqual(list_mock.call_count, 1)
+
+    def test_iter_stops_at_last_page(self):
+        depositions, list_mock = self.make_depositions(23)
+        self.assertEqual(len(list(depositions.iter())), 23)
+        self.assertEqual(list_mock.call_count, 3)
+
+    def test_iter_with_page_size_capped_by_server(self):
+        depositions, _ = self.make_depositions(23, max_size=10)
+        self.assertEqual(len(list(depositions.iter(size=50))), 23)
+
+class TestDepositionsRetrieveMany(unittest.TestCase):
+    def make_depositions(self, existing, latest, max_size=1000):
+        # Searches depositions by ID, only returning the latest versions unless asked otherwise
+        def list_depositions(query):
+            ids = [int(id) for id in re.findall(r'\d+', query['q'])]
+            if not query.get('all_versions'):
+                ids = [id for id in ids if id in latest]
+            ids = [id for id in ids if id in existing]
+            return [{'id': id, 'files': []} for id in ids[:min(query['size'], max_size)]]
+        def retrieve_deposition(id):
+            if id not in existing:
+                raise APIResponseError(make_response(404))
+            return {'id': id, 'files': []}
+        api = Mock()
+        api.api.list_depositions.side_effect = list_depositions
+        api.api.retrieve_deposition.side_effect = retrieve_deposition
+        return Depositions(api), api.api
+
+    def test_retrieve_all_versions_in_order(self):
+        depositions, api = self.make_depositions(existing=set(range(10)), latest={9})
+        result = depositions.retrieve_many([5, 1, 9, 1], chunk=2)
+        self.assertEqual([dep.id for dep in result], [5, 1, 9])
+        self.assertEqual(api.list_depositions.call_count, 2)
+        api.retrieve_deposition.assert_not_called()
+
+    def test_missing_results_are_retrieved_one_by_one(self):
+        depositions, api = self.make_depositions(existing=set(range(10)), latest=set(), 
+                                                 max_size=2)
+        result = depositions.retrieve_many(list(range(10)), chunk=5)
+        self.assertEqual([dep.id for dep in result], list(range(10)))
+        self.assertEqual(api.retrieve_deposition.call_count, 6)
+
+    def test_unknown_ids_are_ignored(self):
+        depositions, _ = self.make_depositions(existing={1, 2}, latest={1, 2})
+        result = depositions.retrieve_many([1, 3, 2])
+        self.assertEqual([dep.id for dep in result], [1, 2])
+
+class TestPagedData(unittest.TestCase):
+    base_url = 'https://example.com/api/licenses'
+
+    def make_pages(self, total=23, size=10):
+        # Serves the license pages by URL, following the 'next' links as Zenodo does
+        pages = dict()
+        num_pages = (total + size - 1) // size
+        for page in range(1, num_pages + 1):
+            url = f'{self.base_url}?page={page}&size={size}'
+            links = {'self': url}
+            if page < num_pages:
+                links['next'] = f'{self.base_url}?page={page + 1}&size={size}'
+            hits = [{'id': f'lic{i}'} for i in range((page - 1) * size, min(page * size, total))]
+            pages[url] = dict(hits={'hits': hits, 'total': total}, links=links)
+        api = Mock()
+        api.api.request.get.side_effect = lambda url: make_response(200, pages[url])
+        start_page = pages[f'{self.base_url}?page=1&size={size}']
+        return LicensesPage(start_page, api), api.api.request.get
+
+    def test_next_page_follows_links_past_page_two(self):
+        paged, get_mock = self.make_pages()
+        self.assertEqual(paged.next_page()[0]['id'], 'lic10')
+        self.assertEqual(paged.next_page()[0]['id'], 'lic20')
+        self.assertEqual(len(paged), 3)
+        with self.assertRaises(StopIteration):
+            paged.next_page()
+        self.assertEqual(get_mock.call_count, 2)
+
+    def test_pages_stop_at_last_page(self):
+        paged, get_mock = self.make_pages()
+        ids = [license['id'] for page in paged.pages for license in page]
+        self.assertEqual(ids, [f'lic{i}' for i in range(23)])
+        self.assertEqual(get_mock.call_count, 2)
+
+    def test_pages_with_single_page(self):
+        paged, get_mock = self.make_pages(total=5)
+        self.assertEqual(len(list(paged.pages)), 1)
+        get_mock.assert_not_called()
+
+    def test_first_page_resets_current_page(self):
+        paged, _ = self.make_pages()
+        paged.next_page()
+        self.assertEqual(paged.first_page()[0]['id'], 'lic0')
+        self.assertEqual(paged.num_pages, 3)
+        self.assertEqual(paged.total, 23)
+
+    def test_prefetch_all(self):
+        paged, get_mock = self.make_pages()
+        pages = paged.prefetch_all(max_workers=2)
+        self.assertEqual([len(page) for page in pages], [10, 10, 3])
+        self.assertEqual(get_mock.call_count, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,27 @@
+import unittest
+from zen.metadata import Publication, Image
+
+class TestMetadataTypes(unittest.TestCase):
+    def test_publication_type(self):
+        metadata = Publication('article')
+        self.assertEqual(metadata.upload_type, 'publication')
+        self.assertEqual(metadata.publication_type, 'article')
+        metadata.publication_type = 'book'
+        self.assertEqual(metadata.publication_type, 'book')
+        self.assertEqual(metadata.data['publication_type'], 'book')
+        with self.assertRaises(ValueError):
+            metadata.publication_type = 'invalid'
+
+    def test_image_type(self):
+        metadata = Image('photo')
+        self.assertEqual(metadata.upload_type, 'image')
+        self.assertEqual(metadata.image_type, 'photo')
+        metadata.image_type = 'plot'
+        self.assertEqual(metadata.image_type, 'plot')
+        self.assertEqual(metadata.data['image_type'], 'plot')
+        with self.assertRaises(ValueError):
+            metadata.image_type = 'invalid'
+
+
+if __name__ == '__main__':
+    unittest.main()
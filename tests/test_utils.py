@@ -0,0 +1,66 @@
+import json
+import math
+import os
+import tempfile
+import threading
+import unittest
+from zen.utils import load_json, save_json
+
+class TestJSONFiles(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.TemporaryDirectory()
+        self.file = os.path.join(self.dir.name, 'data.json')
+
+    def tearDown(self):
+        self.dir.cleanup()
+
+    def test_save_and_load(self):
+        data = {'files': [{'filename': 'a.txt', 'properties': {'size': 1.5}}]}
+        save_json(data, self.file)
+        self.assertEqual(load_json(self.file), data)
+        self.assertEqual(os.listdir(self.dir.name), ['data.json'])
+
+    def test_save_and_load_non_finite_values(self):
+        data = {'files': [{'filename': 'a.txt', 'properties': {'min': float('nan'),
+                                                               'max': float('inf')}}]}
+        save_json(data, self.file)
+        properties = load_json(self.file)['files'][0]['properties']
+        self.assertTrue(math.isnan(properties['min']))
+        self.assertEqual(properties['max'], float('inf'))
+
+    def test_load_file_written_by_json_module(self):
+        with open(self.file, 'w') as f:
+            json.dump({'properties': {'value': float('nan')}}, f, indent=2)
+        self.assertTrue(math.isnan(load_json(self.file)['properties']['value']))
+
+    def test_concurrent_writers(self):
+        def write(i):
+            for _ in range(20):
+                save_json({'writer': i, 'values': list(range(1000))}, self.file)
+        threads = [threading.Thread(target=write, args=(i,)) for i in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(load_json(self.file)['values'], list(range(1000)))
+        self.assertEqual(os.listdir(self.dir.name), ['data.json'])
+
+    def test_failed_write_keeps_target(self):
+        save_json({'a': 1}, self.file)
+        with self.assertRaises(TypeError):
+            save_json({'a': object()}, self.file)
+        self.assertEqual(load_json(self.file), {'a': 1})
+        self.assertEqual(os.listdir(self.dir.name), ['data.json'])
+
+    def test_relative_path(self):
+        cwd = os.getcwd()
+        os.chdir(self.dir.name)
+        try:
+            save_json({'a': 1}, 'data.json')
+        finally:
+            os.chdir(cwd)
+        self.assertEqual(load_json(self.file), {'a': 1})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,109 @@
+"""
+This module implements a simple persistent cache used internally by the package to avoid
+repeating API requests for data that rarely changes, such as the licenses vocabulary.
+
+Examples:
+    The cache stores JSON values by entry type and parameters::
+        
+        from zen._cache import SimpleCache
+        cache = SimpleCache(ttl_config={'license': 86400})
+        
+        # Store and retrieve a value
+        cache.set('license', {'id': 'cc-by-4.0'}, {'id': 'cc-by-4.0', 'title': '...'})
+        cache.get('license', {'id': 'cc-by-4.0'})
+
+"""
+from __future__ import annotations
+from typing import Dict, Any, Optional
+import zen.utils as __utils__
+import hashlib
+import json
+import os
+import time
+
+
+class SimpleCache:
+    """File based cache with a time-to-live (TTL) per entry type.
+    
+    Each entry is stored as a JSON file in `cache_dir`, named after the SHA-256 hash of its type
+    and parameters. An entry expires after the number of seconds configured for its type in
+    `ttl_config`. Entry types not present in `ttl_config` are never cached. Errors while reading
+    or writing the cache files are ignored, so that the cache never prevents a request from
+    being sent to the API.
+    
+    Args:
+        cache_dir (Optional[str]=None): The directory where the entries are stored. A leading '~' 
+            is expanded to the user's home directory. Defaults to '~/.cache/zen'.
+        ttl_config (Optional[Dict[str,int]]=None): The TTL (in seconds) of each entry type.
+            Defaults to `SimpleCache.default_ttl`.
+    
+    """
+    default_ttl = {'license': 86400, 'licenses_list': 3600}
+    
+    def __init__(self, cache_dir: Optional[str]=None,
+                 ttl_config: Optional[Dict[str,int]]=None) -> None:
+        if cache_dir is None:
+            cache_dir = os.path.join('~', '.cache', 'zen')
+        cache_dir = os.path.expanduser(cache_dir)
+        if ttl_config is None:
+            ttl_config = SimpleCache.default_ttl
+        if not isinstance(ttl_config, dict):
+            raise TypeError('Invalid `ttl_config` parameter. Expecting a `dict` but got a ' +
+                            f'`{type(ttl_config)}` instead.')
+        self.cache_dir = cache_dir
+        self.ttl_config = dict(ttl_config)
+    
+    def _path(self, key_type: str, params: Dict[str,Any]) -> str:
+        key = json.dumps([key_type, params], sort_keys=True, default=str)
+        return os.path.join(self.cache_dir, hashlib.sha256(key.encode()).hexdigest() + '.json')
+    
+    def get(self, key_type: str, params: Dict[str,Any]) -> Any:
+        """Retrieves a cached value.
+        
+        Args:
+            key_type (str): The type of the entry.
+            params (Dict[str,Any]): The parameters identifying the entry.
+        
+        Returns:
+            Any: The cached value, or `None` if there is no valid entry.
+        
+        """
+        ttl = self.ttl_config.get(key_type)
+        if not ttl:
+            return None
+        file = self._path(key_type, params)
+        try:
+            if time.time() - os.path.getmtime(file) > ttl:
+                return None
+            return __utils__.load_json(file)
+        except (OSError, ValueError):
+            return None
+    
+    def set(self, key_type: str, params: Dict[str,Any], value: Any) -> None:
+        """Stores a value in the cache.
+        
+        Args:
+            key_type (str): The type of the entry.
+            params (Dict[str,Any]): The parameters identifying the entry.
+            value (Any): The JSON serializable value to be stored.
+        
+        """
+        if not self.ttl_config.get(key_type):
+            return
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            __utils__.save_json(value, self._path(key_type, params))
+        except (OSError, TypeError, ValueError):
+            pass
+    
+    def clear(self) -> None:
+        """Removes all entries from the cache.
+        """
+        if not os.path.isdir(self.cache_dir):
+            return
+        for file in os.listdir(self.cache_dir):
+            if file.endswith('.json'):
+                try:
+                    os.remove(os.path.join(self.cache_dir, file))
+                except OSError:
+                    pass
@@ -14,6 +14,10 @@ Examples:
         
         # Retrieve the first deposition
         dep = zen.depositions.retrieve(deps[0].id)
+        
+        # Close the connections when done, or use `Zenodo` as a context manager
+        with Zenodo(url=Zenodo.sandbox_url, token='your_access_token') as zen:
+            deps = zen.depositions.list(sort="bestmatch", size=10)
     
 Note:
     - Before using this submodule, make sure you have a valid Zenodo account and access token.
@@ -23,7 +27,8 @@ Note:
 
 """
 from __future__ import annotations
-from typing import Tuple, List, Dict, Any, Optional, Union, Iterator, TYPE_CHECKING
+from typing import Tuple, List, Dict, FrozenSet, Mapping, MutableMapping, Any, Optional, Union, \
+    Iterator, AsyncIterator, BinaryIO, TYPE_CHECKING
 from typing_extensions import Self
 if TYPE_CHECKING:
     from requests import Response
@@ -31,8 +36,55 @@ if TYPE_CHECKING:
     from .metadata import Metadata
 import zen.dataset as __dataset__
 import zen.metadata as __metadata__
+import zen.utils as __utils__
+import zen._cache as __cache__
+from collections import OrderedDict
+from copy import deepcopy
+from email.utils import parsedate_to_datetime
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
+from math import ceil
+import asyncio
 import os
 import requests
+import shutil
+import socket
+import tempfile
+import threading
+import time
+import weakref
+from types import MappingProxyType
+from urllib.parse import parse_qsl, urlencode, urlparse, urlunparse
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
+from urllib3.exceptions import UnrewindableBodyError
+from urllib3.util.retry import Retry
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _decode_json(response: Response) -> Any:
+    """Decodes the JSON body of a response, using `orjson` if installed.
+    """
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+
+def _extract_id(value: Union[Any,Dict[str,Any]], *keys: str) -> Any:
+    """Returns the value nested under `keys` (by default, 'id') if `value` is a dictionary, or 
+    `value` itself otherwise.
+    """
+    if isinstance(value, dict):
+        for key in keys or ('id',):
+            value = value[key]
+    return value
 
 
 class APIResponseError(Exception):
@@ -43,6 +95,13 @@ class APIResponseError(Exception):
     Args: 
         response (Response): The response object received from the API. 
     
+    Attributes:
+        status_code (int): The status code of the response.
+        name (str): The name of the status code.
+        description (str): The description of the error.
+        retry_after (Optional[float]): The number of seconds the server asked to wait before 
+            retrying, as sent in the 'Retry-After' header (e.g. on status code 429), or `None`.
+    
     Examples:
         
         >>> from zen import Zenodo
@@ -105,13 +164,26 @@ class APIResponseError(Exception):
         500: {
             "name": "Internal Server Error",
             "description": "Request failed, due to an internal server error."
+        },
+        502: {
+            "name": "Bad Gateway",
+            "description": "Request failed, due to an invalid response from an upstream server."
+        },
+        503: {
+            "name": "Service Unavailable",
+            "description": "Request failed, due to the server being temporarily unavailable."
+        },
+        504: {
+            "name": "Gateway Timeout",
+            "description": "Request failed, due to an upstream server timeout."
         }
     }
-
+    
     def __init__(self, response: Response) -> None:
         self.status_code = response.status_code
-        self.name = APIResponseError.bad_status_codes[self.status_code]['name']
+        self.name = _STATUS_META[self.status_code][0]
         self.description = self.get_respose_description(response)
+        self.retry_after = self._retry_after(response)
         super().__init__(f"Status code {self.status_code} ({self.name}): {self.description}")
     
     def get_respose_description(self, response: Response) -> str:
@@ -124,31 +196,431 @@ class APIResponseError(Exception):
             str: The description of the error. 
         
         """ 
+        default = _STATUS_META[self.status_code][1]
         try:
-            content = response.json()
-            message = content['message']
-            try:
-                error = content['errors'][0]
-                return f"{message} Field '{error['field']}'. {error['message']}"
-            except:
-                return message
-        except:
-            return APIResponseError.bad_status_codes[self.status_code]['description']
+            content = _decode_json(response)
+        except ValueError:
+            return default
+        if not isinstance(content, dict) or not content.get('message'):
+            return default
+        message = content['message']
+        errors = content.get('errors')
+        if isinstance(errors, list) and errors and isinstance(errors[0], dict):
+            error = errors[0]
+            return f"{message} Field '{error.get('field', '?')}'. {error.get('message', '')}"
+        return message
+    
+    @staticmethod
+    def _retry_after(response: Response) -> Optional[float]:
+        value = response.headers.get('Retry-After')
+        if value is None:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        # The header may also be an HTTP date
+        try:
+            date = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        return max(0.0, date.timestamp() - time.time())
+
+
+# Status codes handled as errors, checked on every response
+_BAD_STATUS: FrozenSet[int] = frozenset(APIResponseError.bad_status_codes)
+
+# Read-only (name, description) of each error status code, used to describe errors
+_STATUS_META: Mapping[int,Tuple[str,str]] = MappingProxyType(
+    {code: (meta['name'], meta['description']) 
+     for code, meta in APIResponseError.bad_status_codes.items()})
+
+
+class _RateLimiter:
+    """Internal token bucket to limit the rate of API requests.
+    
+    The bucket holds up to `max_rate` tokens and it is refilled at a rate of `max_rate` tokens 
+    per `time_period` seconds. Every request takes one token from the bucket, waiting for it when 
+    the bucket is empty. This smooths request bursts to the server's rate limit instead of 
+    triggering 429 responses.
+    
+    Args:
+        max_rate (int): The maximum number of requests per time period.
+        time_period (float=60): The length of time period in seconds.
+    
+    """
+    def __init__(self, max_rate: int, time_period: float=60) -> None:
+        if max_rate <= 0:
+            raise ValueError('Invalid `max_rate` parameter. Value must be positive.')
+        self.max_rate = max_rate
+        self.time_period = time_period
+        self._tokens = float(max_rate)
+        self._updated = time.monotonic()
+        self._blocked_until = 0.0
+        self._lock = threading.Lock()
+    
+    def _reserve(self) -> float:
+        # Takes one token and returns how long to wait before using it
+        with self._lock:
+            now = time.monotonic()
+            rate = self.max_rate / self.time_period
+            self._tokens = min(self.max_rate, self._tokens + (now - self._updated) * rate)
+            self._updated = now
+            self._tokens -= 1
+            delay = -self._tokens / rate if self._tokens < 0 else 0.0
+            return max(delay, self._blocked_until - now)
+    
+    def acquire(self) -> None:
+        """Waits until a request can be sent.
+        """
+        delay = self._reserve()
+        if delay > 0:
+            time.sleep(delay)
+    
+    async def acquire_async(self) -> None:
+        """Waits until a request can be sent without blocking the event loop.
+        """
+        delay = self._reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+    
+    def update(self, headers: Dict[str,str]) -> None:
+        """Adjusts the bucket using the rate limit headers sent by the server.
+        
+        If the server reports that less than 5 requests are remaining in current window (header 
+        'X-RateLimit-Remaining'), any further request waits until the window is reset (header 
+        'X-RateLimit-Reset', an epoch timestamp).
+        
+        Args:
+            headers (Dict[str,str]): The headers of the response.
+        
+        """
+        remaining = headers.get('X-RateLimit-Remaining')
+        reset = headers.get('X-RateLimit-Reset')
+        if remaining is None or reset is None:
+            return
+        try:
+            remaining = int(remaining)
+            wait = float(reset) - time.time()
+        except ValueError:
+            return
+        if remaining < 5 and wait > 0:
+            with self._lock:
+                blocked_until = time.monotonic() + min(wait, self.time_period)
+                self._blocked_until = max(self._blocked_until, blocked_until)
+
+
+class _ResponseCache:
+    """Internal LRU cache of validated GET responses.
+    
+    Stores the last responses that carry an 'ETag' or 'Last-Modified' header, so they can be 
+    revalidated by conditional requests. When the server answers a conditional request with 
+    304 (Not Modified), no body is transferred and the stored response is reused. Responses 
+    with a 'Cache-Control: max-age' directive are reused without any request until they 
+    expire, and responses marked as 'no-store' are never stored. Any other request than a GET 
+    invalidates the stored responses of the URLs along its path (see `invalidate()`).
+    
+    Args:
+        maxsize (int=128): The maximum number of responses stored.
+    
+    """
+    def __init__(self, maxsize: int=128) -> None:
+        self.maxsize = maxsize
+        self._responses: OrderedDict[Any,Tuple[Response,float]] = OrderedDict()
+        self._lock = threading.Lock()
+    
+    @staticmethod
+    def key(url: str, params: Optional[Dict[str,Any]], 
+            headers: Optional[Dict[str,Any]]=None) -> Any:
+        """Returns the cache key of a request, or `None` if the request cannot be cached.
+        
+        The request headers are part of the key, so that the same URL requested in different 
+        formats (header 'Accept') or by different users is stored separately.
+        """
+        try:
+            return (url, frozenset(params.items()) if params else None, 
+                    frozenset(headers.items()) if headers else None)
+        except TypeError:
+            return None
+    
+    @staticmethod
+    def max_age(headers: Mapping[str,str]) -> Union[float,None]:
+        """Returns for how many seconds a response can be reused without revalidation, or 
+        `None` if it must not be stored.
+        """
+        directives = [d.strip().lower() for d in headers.get('Cache-Control', '').split(',')]
+        if 'no-store' in directives:
+            return None
+        if 'no-cache' in directives:
+            return 0
+        for directive in directives:
+            if directive.startswith('max-age='):
+                try:
+                    return max(0, int(directive[8:]))
+                except ValueError:
+                    return 0
+        return 0
+    
+    def get(self, key: Any) -> Tuple[Union[Response,None],bool]:
+        """Returns a stored response, if any, and whether it is still fresh.
+        """
+        with self._lock:
+            entry = self._responses.get(key)
+            if entry is None:
+                return None, False
+            self._responses.move_to_end(key)
+            return entry[0], time.monotonic() < entry[1]
+    
+    def validators(self, response: Response) -> Dict[str,str]:
+        """Returns the headers used to revalidate a stored response.
+        """
+        headers = dict()
+        if 'ETag' in response.headers:
+            headers['If-None-Match'] = response.headers['ETag']
+        if 'Last-Modified' in response.headers:
+            headers['If-Modified-Since'] = response.headers['Last-Modified']
+        return headers
+    
+    def set(self, key: Any, response: Response, 
+            headers: Optional[Mapping[str,str]]=None) -> None:
+        """Stores a response. The freshness is computed from `headers` (e.g. of a 304 answer 
+        renewing the response) or from the response headers.
+        """
+        if headers is None:
+            headers = response.headers
+        max_age = _ResponseCache.max_age(headers)
+        if max_age is None:
+            with self._lock:
+                self._responses.pop(key, None)
+            return
+        if not max_age and 'ETag' not in response.headers and \
+                'Last-Modified' not in response.headers:
+            return
+        with self._lock:
+            self._responses[key] = (response, time.monotonic() + max_age)
+            self._responses.move_to_end(key)
+            while len(self._responses) > self.maxsize:
+                self._responses.popitem(last=False)
+    
+    def invalidate(self, url: str) -> None:
+        """Removes the stored responses that may be changed by an unsafe request to `url`.
+        
+        These are the responses of the URL itself, of its parent collections (e.g. the list of 
+        depositions when a deposition is updated) and of the resources under it (e.g. the files 
+        of a deposition when it is published). Query strings are ignored.
+        """
+        path = url.split('?', 1)[0].rstrip('/')
+        with self._lock:
+            for key in list(self._responses):
+                other = key[0].split('?', 1)[0].rstrip('/')
+                if other == path or other.startswith(path + '/') or \
+                        path.startswith(other + '/'):
+                    del self._responses[key]
+
+
+# Methods that do not change the resources on the server, according to RFC 7231
+_SAFE_METHODS: FrozenSet[str] = frozenset(['GET', 'HEAD', 'OPTIONS'])
+
+
+class _TTLCache:
+    """Internal in-memory cache of values that expire after `ttl` seconds.
+    
+    Stored values are deep copied on both ends, so callers can modify them freely.
+    
+    Args:
+        ttl (float=60): The number of seconds a value is kept.
+    
+    """
+    def __init__(self, ttl: float=60) -> None:
+        self.ttl = ttl
+        self._values: Dict[Any,Tuple[float,Any]] = dict()
+        self._lock = threading.Lock()
+    
+    def get(self, key: Any) -> Any:
+        with self._lock:
+            entry = self._values.get(key)
+            if entry is None:
+                return None
+            if time.monotonic() - entry[0] > self.ttl:
+                del self._values[key]
+                return None
+        return deepcopy(entry[1])
+    
+    def set(self, key: Any, value: Any) -> None:
+        with self._lock:
+            self._values[key] = (time.monotonic(), deepcopy(value))
+    
+    def clear(self) -> None:
+        with self._lock:
+            self._values.clear()
+
+
+class _UploadBody:
+    """Internal request body that streams an opened file in large chunks.
+    
+    Defining `__len__` makes `requests` send a `Content-Length` header instead of a chunked
+    transfer encoding, while `tell()` and `seek()` let `urllib3` rewind the file before a
+    retry resends the body.
+    
+    Args:
+        file (BinaryIO): The file opened in binary mode.
+        size (int): The size of the file in bytes.
+        chunk_size (int=8388608): The number of bytes sent at a time.
+    
+    """
+    def __init__(self, file: BinaryIO, size: int, chunk_size: int=1 << 23) -> None:
+        self._file = file
+        self._size = size
+        self.chunk_size = chunk_size
+    
+    def __len__(self) -> int:
+        return self._size
+    
+    def __iter__(self) -> Iterator[bytes]:
+        read = self._file.read
+        chunk = read(self.chunk_size)
+        while chunk:
+            yield chunk
+            chunk = read(self.chunk_size)
+    
+    def tell(self) -> int:
+        return self._file.tell()
+    
+    def seek(self, offset: int, whence: int=0) -> int:
+        return self._file.seek(offset, whence)
+
+
+class _Retry(Retry):
+    """Internal retry policy that never resends a POST request the server may have processed.
+    
+    POST requests (e.g. creating, publishing or versioning a deposition) are not idempotent: 
+    resending one after a 5xx answer could repeat an action that actually succeeded. They are 
+    only retried on connection errors, when nothing reached the server, and on 429 (Too Many 
+    Requests), when the server refused to process them.
+    
+    """
+    def is_retry(self, method: str, status_code: int, has_retry_after: bool=False) -> bool:
+        if method.upper() == 'POST':
+            return status_code == 429 and bool(self.total)
+        return super().is_retry(method, status_code, has_retry_after)
+
+
+def _keepalive_socket_options(idle: int=45, interval: int=15, count: int=4) -> List[Tuple]:
+    # The system default idle time before the first probe (7200 seconds on Linux) is longer than 
+    # the idle timeout of most load balancers, so it is shortened where the platform allows it
+    options = [(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)]
+    if hasattr(socket, 'TCP_KEEPIDLE'):
+        options.append((socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, idle))
+    elif hasattr(socket, 'TCP_KEEPALIVE'):
+        # macOS names the idle time option differently
+        options.append((socket.IPPROTO_TCP, socket.TCP_KEEPALIVE, idle))
+    if hasattr(socket, 'TCP_KEEPINTVL'):
+        options.append((socket.IPPROTO_TCP, socket.TCP_KEEPINTVL, interval))
+    if hasattr(socket, 'TCP_KEEPCNT'):
+        options.append((socket.IPPROTO_TCP, socket.TCP_KEEPCNT, count))
+    return options
+
+
+class _KeepAliveAdapter(HTTPAdapter):
+    """Internal HTTP adapter that enables TCP keep-alive on its pooled connections.
+    
+    Idle connections are probed after 45 seconds, and every 15 seconds afterwards, where the 
+    platform supports setting these intervals. This keeps long-lived sessions from being 
+    silently dropped by proxies and load balancers between requests (e.g. while a large file is 
+    being processed), which would otherwise cost a reconnection and a new TLS handshake. On 
+    other platforms, the system keep-alive intervals apply.
+    
+    """
+    socket_options = HTTPConnection.default_socket_options + _keepalive_socket_options()
+    
+    def init_poolmanager(self, *args, **kwargs) -> None:
+        kwargs.setdefault('socket_options', self.socket_options)
+        super().init_poolmanager(*args, **kwargs)
+    
+    def proxy_manager_for(self, *args, **kwargs):
+        kwargs.setdefault('socket_options', self.socket_options)
+        return super().proxy_manager_for(*args, **kwargs)
 
 
 class _APIRequest:
     """Internal class for handling API 
     
-    This class prepares HTTP requests and handles responses.
+    This class prepares HTTP requests and handles responses. All requests are sent through a 
+    single `requests.Session`, so that TCP connections (and TLS handshakes) are reused across 
+    calls to the same host. Identical GET requests issued while one of them is in flight wait 
+    for its response instead of being sent again.
     """ 
-    def __init__(self, token: Optional[str]=None, params: Optional[Dict[str,str]]=None, 
-                 headers: Optional[Dict[str,str]]=None) -> None:
+    __slots__ = ('_params', '_headers', '_owns_session', '_session', '_adapter_key', '_timeout', 
+                 '_limiter', '_responses', '_inflight', '_inflight_lock', '_inflight_async')
+    _adapters: Dict[Tuple[int,int],HTTPAdapter] = dict()
+    _adapters_owners: Dict[Tuple[int,int],int] = dict()
+    _adapters_lock = threading.Lock()
+    
+    def __init__(self, *, token: Optional[str]=None, params: Optional[Dict[str,str]]=None, 
+                 headers: Optional[Dict[str,str]]=None, 
+                 session: Optional[requests.Session]=None, 
+                 rate_limit: Optional[int]=100, pool_size: int=25, 
+                 max_retries: int=5, 
+                 timeout: Optional[Tuple[Optional[float],Optional[float]]]=None) -> None:
         if token is not None:
             params = _APIRequest._merge_dicts(params, {'access_token': f'{token}'})
             headers = _APIRequest._merge_dicts(headers, {'Authorization': f'Bearer {token}'})
         self._params = params
         self._headers = headers
+        self._adapter_key = None
+        if session is None:
+            session = requests.Session()
+            adapter = _APIRequest._shared_adapter(pool_size, max_retries)
+            self._adapter_key = (pool_size, max_retries)
+            session.mount('http://', adapter)
+            session.mount('https://', adapter)
+            self._owns_session = True
+        else:
+            self._owns_session = False
+        self._session = session
+        # Other session-like clients may have their own timeout defaults and formats
+        self._timeout = timeout if isinstance(session, requests.Session) else None
+        self._limiter = _RateLimiter(rate_limit, 60) if rate_limit is not None else None
+        self._responses = _ResponseCache()
+        self._inflight: Dict[Any,Future] = dict()
+        self._inflight_lock = threading.Lock()
+        self._inflight_async: MutableMapping[asyncio.AbstractEventLoop,Dict[Any,asyncio.Future]] = \
+            weakref.WeakKeyDictionary()
 
+    @staticmethod
+    def _shared_adapter(pool_size: int, max_retries: int) -> HTTPAdapter:
+        # The connection pools are shared by all default sessions with the same settings, so 
+        # that new instances (e.g. a new `Zenodo` object) reuse the open connections. Owners 
+        # are counted, so that the pools are closed along with the last session using them.
+        key = (pool_size, max_retries)
+        with _APIRequest._adapters_lock:
+            _APIRequest._adapters_owners[key] = _APIRequest._adapters_owners.get(key, 0) + 1
+            adapter = _APIRequest._adapters.get(key)
+            if adapter is None:
+                # Transient errors and rate limiting are retried with exponential backoff. Other 
+                # errors (e.g. 4xx) fail fast. When retries are exhausted, the last response is 
+                # returned and handled as usual. POST requests are only retried on 429.
+                retries = _Retry(total=max_retries, backoff_factor=0.5, 
+                                 status_forcelist=(429, 500, 502, 503, 504), 
+                                 allowed_methods=frozenset(['GET', 'PUT', 'DELETE']), 
+                                 respect_retry_after_header=True, raise_on_status=False)
+                adapter = _KeepAliveAdapter(pool_connections=pool_size, pool_maxsize=pool_size, 
+                                            pool_block=False, max_retries=retries)
+                _APIRequest._adapters[key] = adapter
+            return adapter
+    
+    @staticmethod
+    def _release_adapter(key: Tuple[int,int]) -> None:
+        with _APIRequest._adapters_lock:
+            owners = _APIRequest._adapters_owners.get(key, 0) - 1
+            if owners > 0:
+                _APIRequest._adapters_owners[key] = owners
+                return
+            _APIRequest._adapters_owners.pop(key, None)
+            adapter = _APIRequest._adapters.pop(key, None)
+        if adapter is not None:
+            adapter.close()
+    
     @staticmethod
     def _merge_dicts(params1: Optional[Dict[str,Any]], 
                      params2: Optional[Dict[str,Any]]) -> Union[Dict[str,Any],None]:
@@ -167,20 +639,25 @@ class _APIRequest:
  
         Returns: 
             Tuple[Dict,Dict,Dict]: A tuple containing the parameters, headers, and remaining 
-                keyword arguments. 
+                keyword arguments. The instance parameters and headers are returned without 
+                copying when there is nothing to merge, so they must not be modified. If 
+                `orjson` is installed, a `json` payload is replaced by its serialized `data`. 
  
         Raises: 
             None 
         
         """ 
         params = self._params
-        if 'params' in kwargs:
-            params = _APIRequest._merge_dicts(params, kwargs['params'])
-            del kwargs['params']
+        extra = kwargs.pop('params', None)
+        if extra:
+            params = {**(params or {}), **extra}
         headers = self._headers
-        if 'headers' in kwargs:
-            headers = _APIRequest._merge_dicts(headers, kwargs['headers'])
-            del kwargs['headers']
+        extra = kwargs.pop('headers', None)
+        if orjson is not None and kwargs.get('json') is not None:
+            kwargs['data'] = orjson.dumps(kwargs.pop('json'), option=orjson.OPT_NON_STR_KEYS)
+            extra = {'Content-Type': 'application/json', **(extra or {})}
+        if extra:
+            headers = {**(headers or {}), **extra}
         return params, headers, kwargs
     
     def url_token(self, url: str, **kwargs) -> str:
@@ -195,10 +672,181 @@ class _APIRequest:
         
         """ 
         params, _, _ = self._prepare_params_headers(**kwargs)
+        params_items = tuple(params.items()) if params else ()
+        try:
+            return _APIRequest._build_url_with_token(url, params_items)
+        except TypeError:
+            # Unhashable parameter values (e.g. lists) are not cached
+            return _APIRequest._build_url_with_token.__wrapped__(url, params_items)
+    
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _build_url_with_token(url: str, params_items: Tuple[Tuple[str,Any],...]) -> str:
+        # The URL is prepared as `requests` would send it (e.g. repeated query keys are kept 
+        # and the path is percent-encoded)
         prep = requests.models.PreparedRequest()
-        prep.prepare_url(url, params=params)
+        prep.prepare_url(url, params=dict(params_items))
         return prep.url
     
+    def _request(self, method: str, url: str, **kwargs) -> Response:
+        """Performs an HTTP request to the specified URL using the current session. 
+        
+        Args: 
+            method (str): The HTTP method of the request (e.g. 'GET', 'POST'). 
+            url (str): The URL to send the request to. 
+            **kwargs: Additional keyword arguments for the request. 
+        
+        Returns: 
+            Response: The response object received from the request. 
+        
+        Raises: 
+            APIResponseError: If the response status code indicates an error. 
+        
+        """ 
+        params, headers, kwargs = self._prepare_params_headers(**kwargs)
+        key = self._inflight_key(method, url, params, headers, kwargs)
+        if key is None:
+            return self._send(method, url, params, headers, **kwargs)
+        # Identical GET requests sent at the same time share a single response
+        with self._inflight_lock:
+            future = self._inflight.get(key)
+            if future is not None:
+                owner = False
+            else:
+                owner = True
+                future = self._inflight[key] = Future()
+        if not owner:
+            return future.result()
+        try:
+            response = self._send(method, url, params, headers, **kwargs)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(response)
+            return response
+        finally:
+            with self._inflight_lock:
+                self._inflight.pop(key, None)
+    
+    @staticmethod
+    def _inflight_key(method: str, url: str, params: Optional[Dict[str,Any]], 
+                      headers: Optional[Dict[str,Any]], kwargs: Dict[str,Any]) -> Any:
+        # Only non-streamed GET requests are coalesced
+        if method != 'GET' or kwargs.get('stream', False):
+            return None
+        try:
+            return (url, frozenset(params.items()) if params else None, 
+                    frozenset(headers.items()) if headers else None, frozenset(kwargs.items()))
+        except TypeError:
+            return None
+    
+    def _send(self, method: str, url: str, params: Optional[Dict[str,Any]], 
+              headers: Optional[Dict[str,Any]], **kwargs) -> Response:
+        # Revalidate previous responses of the same GET request, if any
+        key = None
+        cached = None
+        if method == 'GET' and not kwargs.get('stream', False):
+            key = _ResponseCache.key(url, params, headers)
+        if key is not None:
+            cached, fresh = self._responses.get(key)
+            if fresh:
+                return cached
+            if cached is not None:
+                headers = {**(headers or {}), **self._responses.validators(cached)}
+        if self._limiter is not None:
+            self._limiter.acquire()
+        if self._timeout is not None:
+            kwargs.setdefault('timeout', self._timeout)
+        try:
+            response = self._session.request(method, url, params=params, headers=headers, 
+                                             **kwargs)
+        finally:
+            # Even a failed request may have changed the resource on the server
+            if method not in _SAFE_METHODS:
+                self._responses.invalidate(url)
+        if self._limiter is not None:
+            self._limiter.update(response.headers)
+        if cached is not None and response.status_code == 304:
+            self._responses.set(key, cached, response.headers)
+            return cached
+        if response.status_code in _BAD_STATUS:
+            raise APIResponseError(response)
+        if key is not None and response.status_code == 200:
+            self._responses.set(key, response)
+        return response
+    
+    async def _request_async(self, session: aiohttp.ClientSession, method: str, url: str, 
+                             **kwargs) -> Response:
+        """Performs an HTTP request to the specified URL using an `aiohttp` session. 
+        
+        The response body is read in full and wrapped in a `requests.Response` object, so the 
+        result can be handled the same way as the ones returned by synchronous requests. 
+        
+        Args: 
+            session (aiohttp.ClientSession): The session used to send the request. 
+            method (str): The HTTP method of the request (e.g. 'GET', 'POST'). 
+            url (str): The URL to send the request to. 
+            **kwargs: Additional keyword arguments for the request. 
+        
+        Returns: 
+            Response: The response object received from the request. 
+        
+        Raises: 
+            APIResponseError: If the response status code indicates an error. 
+        
+        """ 
+        params, headers, kwargs = self._prepare_params_headers(**kwargs)
+        key = self._inflight_key(method, url, params, headers, kwargs)
+        if key is None:
+            return await self._send_async(session, method, url, params, headers, **kwargs)
+        # Identical GET requests awaited at the same time in the event loop share a single response
+        loop = asyncio.get_event_loop()
+        inflight = self._inflight_async.setdefault(loop, dict())
+        if key in inflight:
+            return await asyncio.shield(inflight[key])
+        future = inflight[key] = loop.create_future()
+        # Avoids warnings of exceptions never retrieved when there are no other waiters
+        future.add_done_callback(lambda f: f.cancelled() or f.exception())
+        try:
+            response = await self._send_async(session, method, url, params, headers, **kwargs)
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(response)
+            return response
+        finally:
+            inflight.pop(key, None)
+    
+    async def _send_async(self, session: aiohttp.ClientSession, method: str, url: str, 
+                          params: Optional[Dict[str,Any]], headers: Optional[Dict[str,Any]], 
+                          **kwargs) -> Response:
+        if params is not None:
+            # aiohttp only accepts string and numeric query values
+            params = {k: v if isinstance(v, (str, int)) and not isinstance(v, bool) else str(v) 
+                      for k, v in params.items()}
+        if self._limiter is not None:
+            await self._limiter.acquire_async()
+        async with session.request(method, url, params=params, headers=headers, **kwargs) as r:
+            content = await r.read()
+        if self._limiter is not None:
+            self._limiter.update(r.headers)
+        if method not in _SAFE_METHODS:
+            self._responses.invalidate(url)
+        response = requests.Response()
+        response.status_code = r.status
+        response.headers.update(r.headers)
+        response.url = str(r.url)
+        response.encoding = r.charset
+        response._content = content
+        if response.status_code in _BAD_STATUS:
+            raise APIResponseError(response)
+        return response
+    
     def get(self, url: str, **kwargs) -> Response:
         """Performs a GET request to the specified URL. 
         
@@ -213,11 +861,7 @@ class _APIRequest:
             APIResponseError: If the response status code indicates an error. 
         
         """ 
-        params, headers, kwargs = self._prepare_params_headers(**kwargs)
-        response = requests.get(url, params=params, headers=headers, **kwargs)
-        if response.status_code in APIResponseError.bad_status_codes:
-            raise APIResponseError(response)
-        return response
+        return self._request('GET', url, **kwargs)
     
     def post(self, url: str, **kwargs) -> Response:
         """Performs a POST request to the specified URL. 
@@ -233,11 +877,7 @@ class _APIRequest:
             APIResponseError: If the response status code indicates an error. 
         
         """ 
-        params, headers, kwargs = self._prepare_params_headers(**kwargs)
-        response = requests.post(url, params=params, headers=headers, **kwargs)
-        if response.status_code in APIResponseError.bad_status_codes:
-            raise APIResponseError(response)
-        return response
+        return self._request('POST', url, **kwargs)
     
     def put(self, url: str, **kwargs) -> Response:
         """Performs a PUT request to the specified URL. 
@@ -253,11 +893,7 @@ class _APIRequest:
             APIResponseError: If the response status code indicates an error. 
         
         """ 
-        params, headers, kwargs = self._prepare_params_headers(**kwargs)
-        response = requests.put(url, params=params, headers=headers, **kwargs)
-        if response.status_code in APIResponseError.bad_status_codes:
-            raise APIResponseError(response)
-        return response
+        return self._request('PUT', url, **kwargs)
     
     def delete(self, url: str, **kwargs) -> Response:
         """Performs a DELETE request to the specified URL. 
@@ -273,11 +909,63 @@ class _APIRequest:
             APIResponseError: If the response status code indicates an error. 
         
         """ 
-        params, headers, kwargs = self._prepare_params_headers(**kwargs)
-        response = requests.delete(url, params=params, headers=headers, **kwargs)
-        if response.status_code in APIResponseError.bad_status_codes:
-            raise APIResponseError(response)
-        return response
+        return self._request('DELETE', url, **kwargs)
+    
+    def download(self, url: str, dest_file: str, chunk_size: int=1 << 20, **kwargs) -> str:
+        """Downloads the content of the specified URL to a local file. 
+        
+        The response is streamed and copied to the file in chunks of `chunk_size` bytes, so the 
+        memory usage does not depend on the file size. 
+        
+        Args: 
+            url (str): The URL to download. 
+            dest_file (str): The path where the downloaded file should be saved. 
+            chunk_size (int=1048576): The size (in bytes) of the chunks copied to the file. 
+            **kwargs: Additional keyword arguments for the GET request. 
+        
+        Returns: 
+            str: The path of the downloaded file. 
+        
+        Raises: 
+            APIResponseError: If the response status code indicates an error. 
+        
+        """ 
+        response = self._request('GET', url, stream=True, **kwargs)
+        try:
+            response.raise_for_status()
+            # Content-Encoding (e.g. gzip) is decoded while reading the raw stream
+            response.raw.decode_content = True
+            with open(dest_file, 'wb') as file:
+                shutil.copyfileobj(response.raw, file, chunk_size)
+        finally:
+            response.close()
+        return dest_file
+    
+    def close(self) -> None:
+        """Closes the connections opened by the session. 
+        
+        Only the session created by this object is closed. A session provided by the caller is 
+        left open, as it may still be in use elsewhere. The connection pools shared by the 
+        default sessions are closed when the last instance using them is closed. 
+        
+        """ 
+        if self._owns_session:
+            with _APIRequest._adapters_lock:
+                shared = list(_APIRequest._adapters.values())
+            for adapter in self._session.adapters.values():
+                if not any(adapter is other for other in shared):
+                    adapter.close()
+            if self._adapter_key is not None:
+                _APIRequest._release_adapter(self._adapter_key)
+                self._adapter_key = None
+            self._session.cookies.clear()
+        self._responses = _ResponseCache()
+    
+    def __enter__(self) -> Self:
+        return self
+    
+    def __exit__(self, *args) -> None:
+        self.close()
 
 
 class APIZenodo:
@@ -293,12 +981,57 @@ class APIZenodo:
             API requests. 
         headers (Optional[Dict[str,str]]=None): Additional headers to be included in the 
             API requests. 
+        session (Optional[requests.Session]=None): The session used to send the API requests. 
+            It can be a `requests.Session` or any object with the same interface, including 
+            the `stream` argument of `request()` and the `raw` attribute of streamed 
+            responses. If not provided, a new session with a connection pool is created. 
+        rate_limit (Optional[int]=100): The maximum number of API requests per minute. If `None`, 
+            requests are not rate limited. 
+        pool_size (int=25): The maximum number of connections kept open to the server. Ignored 
+            if `session` is provided. 
+        max_retries (int=5): The maximum number of retries of requests failed due to rate 
+            limiting (429) or transient server errors (5xx). POST requests are not retried on 
+            5xx errors. Ignored if `session` is provided. 
+        connect_timeout (Optional[float]=10): The number of seconds to wait for a connection to 
+            the server. If `None`, waits forever. 
+        read_timeout (Optional[float]=300): The number of seconds to wait for the server to send 
+            data. If `None`, waits forever. Both timeouts apply to requests without a `timeout` 
+            argument, and are ignored if `session` is not a `requests.Session`. They also apply 
+            to the download of remote files uploaded by URL. 
     
     """ 
+    __slots__ = ('_base_url', '_licenses_url', '_records_url', '_depositions_url', '_records', 
+                 '_buckets', '_timeout', '_req')
+    
     def __init__(self, base_url: str, token: Optional[str]=None, params: Optional[Dict[str,str]]=None, 
-                 headers: Optional[Dict[str,str]]=None) -> None:
-        self.base_url = base_url.rstrip('/')
-        self._req = _APIRequest(token, params, headers)
+                 headers: Optional[Dict[str,str]]=None, 
+                 session: Optional[requests.Session]=None, 
+                 rate_limit: Optional[int]=100, pool_size: int=25, max_retries: int=5, 
+                 connect_timeout: Optional[float]=10, read_timeout: Optional[float]=300) -> None:
+        self.base_url = base_url
+        # Published records rarely change, so they are memoized for a short time
+        self._records = _TTLCache(60)
+        # The bucket of a deposition does not change while it is editable
+        self._buckets: Dict[int,str] = dict()
+        self._timeout = (connect_timeout, read_timeout)
+        self._req = _APIRequest(token=token, params=params, headers=headers, session=session, 
+                                rate_limit=rate_limit, pool_size=pool_size, 
+                                max_retries=max_retries, 
+                                timeout=(connect_timeout, read_timeout))
+    
+    @property
+    def base_url(self) -> str:
+        """The base URL of the Zenodo API.
+        """ 
+        return self._base_url
+    
+    @base_url.setter
+    def base_url(self, value: str) -> None:
+        # The endpoint URLs are built once, instead of on every request
+        self._base_url = value.rstrip('/')
+        self._licenses_url = f"{self._base_url}/api/licenses"
+        self._records_url = f"{self._base_url}/api/records"
+        self._depositions_url = f"{self._base_url}/api/deposit/depositions"
     
     def url_token(self, url: str, **kwargs) -> str:
         """Returns a provided base url with the Zenodo API token as a query string parameter. 
@@ -313,6 +1046,23 @@ class APIZenodo:
         """ 
         return self._req.url_token(url, **kwargs)
     
+    def download_file(self, url: str, dest_file: str, **kwargs) -> str:
+        """Downloads a file from the Zenodo API to a local path. 
+        
+        Args: 
+            url (str): The download URL of the file. 
+            dest_file (str): The path where the downloaded file should be saved. 
+            **kwargs: Additional keyword arguments for the API request. 
+        
+        Returns: 
+            str: The path of the downloaded file. 
+        
+        Raises: 
+            APIResponseError: If the response status code indicates an error during the API request. 
+        
+        """ 
+        return self._req.download(url, dest_file, **kwargs)
+    
     def list_licenses(self, query_args: Optional[Dict[str,Any]]=None, 
                           **kwargs) -> Dict:
         """Retrieves a list of licenses entries.
@@ -332,9 +1082,9 @@ class APIZenodo:
         if query_args is not None and not isinstance(query_args, dict):
             raise TypeError('Invalid `query_args` parameter. Value must be `dict` but got ' +
                             f'`{type(query_args)}`.')
-        url = f"{self.base_url}/api/licenses"
+        url = self._licenses_url
         response = self._req.get(url, params=query_args, **kwargs)
-        return response.json()
+        return _decode_json(response)
     
     def retrieve_license(self, license_id: str, **kwargs) -> Dict:
         """Retrieves a specific license entry from the Zenodo API. 
@@ -350,11 +1100,10 @@ class APIZenodo:
             APIResponseError: If the response status code indicates an error during the API request. 
         
         """ 
-        if isinstance(license_id, dict):
-            license_id = license_id['id']
-        url = f"{self.base_url}/api/licenses/{license_id}"
+        license_id = _extract_id(license_id)
+        url = f"{self._licenses_url}/{license_id}"
         response = self._req.get(url, **kwargs)
-        return response.json()
+        return _decode_json(response)
     
     def list_records(self, query_args: Optional[Dict[str,Any]]=None, **kwargs) -> Dict:
         """Retrieves a list of records from the Zenodo API. 
@@ -373,9 +1122,18 @@ class APIZenodo:
         if query_args is not None and not isinstance(query_args, dict):
             raise TypeError('Invalid `query_args` parameter. Value must be `dict` but got ' +
                             f'`{type(query_args)}` instead.')
-        url = f"{self.base_url}/api/records"
+        url = self._records_url
+        # Only requests without extra arguments are memoized
+        key = _ResponseCache.key(url, query_args) if not kwargs else None
+        if key is not None:
+            data = self._records.get(key)
+            if data is not None:
+                return data
         response = self._req.get(url, params=query_args, **kwargs)
-        return response.json()
+        data = _decode_json(response)
+        if key is not None:
+            self._records.set(key, data)
+        return data
     
     def retrieve_record(self, record_id: Union[int,Dict], **kwargs) -> Dict:
         """Retrieves a specific record from the Zenodo API. 
@@ -391,14 +1149,25 @@ class APIZenodo:
         Raises: 
             APIResponseError: If the response status code indicates an error during the API request. 
         """ 
-        if isinstance(record_id, dict):
-            record_id = record_id['id']
-        url = f"{self.base_url}/api/records/{record_id}"
+        record_id = _extract_id(record_id)
+        url = f"{self._records_url}/{record_id}"
+        # Only requests without extra arguments are memoized
+        key = _ResponseCache.key(url, None) if not kwargs else None
+        if key is not None:
+            data = self._records.get(key)
+            if data is not None:
+                return data
         response = self._req.get(url, **kwargs)
-        return response.json()
+        data = _decode_json(response)
+        if key is not None:
+            self._records.set(key, data)
+        return data
     
     def iter_pagination(self, data: Dict[str,Any], limit: Optional[int]=None, **kwargs) -> Iterator[Dict[str,Any]]:
         """Iterates over paginated data from the Zenodo API. 
+        
+        The next page is requested in a background thread as soon as a page is yielded, so that 
+        it is downloaded while the caller processes the current page. 
     
         Args: 
             data (Dict[str,Any]): The initial page of data from the API response. 
@@ -408,18 +1177,71 @@ class APIZenodo:
         Returns: 
             Iterator[Dict[str,Any]]: An iterator that yields each page of data. 
     
+        Raises: 
+            APIResponseError: If the response status code indicates an error during the API request. 
+        """ 
+        def fetch(url: str) -> Dict[str,Any]:
+            return _decode_json(self._req.get(url, **kwargs))
+        page = data
+        future = None
+        i = 0
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            try:
+                while True:
+                    url = page.get('links', {}).get('next')
+                    if url is not None and (limit is None or i < limit):
+                        future = executor.submit(fetch, url)
+                    else:
+                        future = None
+                    yield page
+                    if future is None:
+                        return
+                    page = future.result()
+                    i += 1
+            finally:
+                if future is not None:
+                    future.cancel()
+    
+    async def iter_pagination_async(self, session: aiohttp.ClientSession, data: Dict[str,Any], 
+                                    limit: Optional[int]=None, 
+                                    **kwargs) -> AsyncIterator[Dict[str,Any]]:
+        """Iterates over paginated data from the Zenodo API using an `aiohttp` session. 
+        
+        The next page is requested as soon as a page is yielded, so that it is downloaded while 
+        the caller processes the current page. 
+    
+        Args: 
+            session (aiohttp.ClientSession): The session used to send the requests. 
+            data (Dict[str,Any]): The initial page of data from the API response. 
+            limit (Optional[int]=None): The maximum number of pages to retrieve. 
+            **kwargs: Additional keyword arguments for the API request. 
+    
+        Returns: 
+            AsyncIterator[Dict[str,Any]]: An asynchronous iterator that yields each page of data. 
+    
         Raises: 
             APIResponseError: If the response status code indicates an error during the API request. 
         """ 
         page = data
-        yield page
+        task = None
         i = 0
-        while 'links' in page and 'next' in page['links'] and (limit is None or i < limit):
-            url = page['links']['next']
-            response = self._req.get(url, **kwargs)
-            page = response.json()
-            yield page
-            i += 1
+        try:
+            while True:
+                url = page.get('links', {}).get('next')
+                if url is not None and (limit is None or i < limit):
+                    task = asyncio.ensure_future(self._req._request_async(session, 'GET', url, 
+                                                                          **kwargs))
+                else:
+                    task = None
+                yield page
+                if task is None:
+                    return
+                page = _decode_json(await task)
+                i += 1
+        finally:
+            # The prefetched page is not needed if the caller stops iterating
+            if task is not None and not task.done():
+                task.cancel()
     
     def list_depositions(self, query_args: Optional[Dict[str,Any]]=None, **kwargs) -> Dict:
         """Retrieves a list of depositions from the Zenodo API. 
@@ -438,9 +1260,32 @@ class APIZenodo:
         if query_args is not None and not isinstance(query_args, dict):
             raise TypeError('Invalid `query_args` parameter. Value must be `dict` but got ' +
                             f'`{type(query_args)}` instead.')
-        url = f"{self.base_url}/api/deposit/depositions"
+        url = self._depositions_url
         response = self._req.get(url, params=query_args, **kwargs)
-        return response.json()
+        return _decode_json(response)
+    
+    async def list_depositions_async(self, session: aiohttp.ClientSession, 
+                                     query_args: Optional[Dict[str,Any]]=None, **kwargs) -> Dict:
+        """Retrieves a list of depositions from the Zenodo API using an `aiohttp` session. 
+    
+        Args: 
+            session (aiohttp.ClientSession): The session used to send the request. 
+            query_args (Optional[Dict[str,Any]]=None): Additional query arguments for the API request. 
+            **kwargs: Additional keyword arguments for the API request. 
+    
+        Returns: 
+            dict: The response JSON containing the list of depositions. 
+    
+        Raises: 
+            TypeError: If the query_args parameter is not a dictionary. 
+            APIResponseError: If the response status code indicates an error during the API request. 
+        """ 
+        if query_args is not None and not isinstance(query_args, dict):
+            raise TypeError('Invalid `query_args` parameter. Value must be `dict` but got ' +
+                            f'`{type(query_args)}` instead.')
+        url = self._depositions_url
+        response = await self._req._request_async(session, 'GET', url, params=query_args, **kwargs)
+        return _decode_json(response)
     
     def create_deposition(self, metadata: Optional[Dict[str,Any]]=None, **kwargs) -> Dict:
         """Creates a new deposition on the Zenodo API. 
@@ -461,11 +1306,11 @@ class APIZenodo:
         if not isinstance(metadata, dict):
             raise TypeError('Invalid `metadata` parameter. Value must be `dict` but got ' +
                             f'`{type(metadata)}` instead.')
-        if len(metadata) > 0 and 'metadata' not in metadata:
-            metadata = dict(metadata=metadata)
-        url = f"{self.base_url}/api/deposit/depositions"
+        if metadata and 'metadata' not in metadata:
+            metadata = {'metadata': metadata}
+        url = self._depositions_url
         response = self._req.post(url, json=metadata, **kwargs)
-        return response.json()
+        return _decode_json(response)
         
     
     def retrieve_deposition(self, deposition_id: Union[int,Dict], **kwargs) -> Dict:
@@ -483,14 +1328,38 @@ class APIZenodo:
             APIResponseError: If the response status code indicates an error during the API request. 
         
         """ 
-        if isinstance(deposition_id, dict):
-            deposition_id = deposition_id['id']
+        deposition_id = _extract_id(deposition_id)
         if not isinstance(deposition_id, int):
             raise TypeError('Invalid `deposition_id` parameter. Value must be `int` but got ' +
                             f'`{type(deposition_id)}`.')
-        url = f"{self.base_url}/api/deposit/depositions/{deposition_id}"
+        url = f"{self._depositions_url}/{deposition_id}"
         response = self._req.get(url, **kwargs)
-        return response.json()
+        return _decode_json(response)
+    
+    async def retrieve_deposition_async(self, session: aiohttp.ClientSession, 
+                                        deposition_id: Union[int,Dict], **kwargs) -> Dict:
+        """Retrieves a specific deposition from the Zenodo API using an `aiohttp` session.
+
+        Args: 
+            session (aiohttp.ClientSession): The session used to send the request. 
+            deposition_id (Union[int,Dict]): The ID of the deposition to retrieve, or a dictionary 
+                containing the deposition information. 
+            **kwargs: Additional keyword arguments for the API request. 
+        
+        Returns: 
+            dict: The response JSON containing the deposition information. 
+        
+        Raises: 
+            APIResponseError: If the response status code indicates an error during the API request. 
+        
+        """ 
+        deposition_id = _extract_id(deposition_id)
+        if not isinstance(deposition_id, int):
+            raise TypeError('Invalid `deposition_id` parameter. Value must be `int` but got ' +
+                            f'`{type(deposition_id)}`.')
+        url = f"{self._depositions_url}/{deposition_id}"
+        response = await self._req._request_async(session, 'GET', url, **kwargs)
+        return _decode_json(response)
     
     def update_deposition(self, deposition_id: Union[int,Dict], 
                           metadata: Dict[str,Any], **kwargs) -> Dict:
@@ -510,16 +1379,16 @@ class APIZenodo:
             APIResponseError: If the response status code indicates an error during the API request. 
 
         """ 
-        if isinstance(deposition_id, dict):
-            deposition_id = deposition_id['id']
+        deposition_id = _extract_id(deposition_id)
         if not isinstance(metadata, dict):
             raise TypeError('Invalid `metadata` parameter. Value must be `dict` but got ' +
                             f'`{type(metadata)}` instead.')
         if 'metadata' not in metadata:
-            metadata = dict(metadata=metadata)
-        url = f"{self.base_url}/api/deposit/depositions/{deposition_id}"
+            metadata = {'metadata': metadata}
+        self._buckets.pop(deposition_id, None)
+        url = f"{self._depositions_url}/{deposition_id}"
         response = self._req.put(url, json=metadata, **kwargs)
-        return response.json()
+        return _decode_json(response)
     
     def delete_deposition(self, deposition_id: Union[int,Dict], **kwargs) -> None:
         """Deletes a specific deposition from the Zenodo API. 
@@ -536,9 +1405,9 @@ class APIZenodo:
             APIResponseError: If the response status code indicates an error during the API request. 
         
         """ 
-        if isinstance(deposition_id, dict):
-            deposition_id = deposition_id['id']
-        url = f"{self.base_url}/api/deposit/depositions/{deposition_id}"
+        deposition_id = _extract_id(deposition_id)
+        self._buckets.pop(deposition_id, None)
+        url = f"{self._depositions_url}/{deposition_id}"
         self._req.delete(url, **kwargs)
         
     def get_deposition_bucket(self, deposition_id: Union[int,Dict]) -> str:
@@ -555,10 +1424,14 @@ class APIZenodo:
             APIResponseError: If the response status code indicates an error during the API request. 
         
         """ 
-        if not isinstance(deposition_id, dict) or 'links' not in deposition_id or \
-            'bucket' not in deposition_id['links']:
-            deposition_id = self.retrieve_deposition(deposition_id)
-        return deposition_id['links']['bucket']
+        if isinstance(deposition_id, dict) and 'bucket' in deposition_id.get('links', {}):
+            return deposition_id['links']['bucket']
+        key = _extract_id(deposition_id)
+        bucket = self._buckets.get(key) if isinstance(key, int) else None
+        if bucket is None:
+            bucket = self.retrieve_deposition(deposition_id)['links']['bucket']
+            self._buckets[key] = bucket
+        return bucket
     
     def list_deposition_files(self, deposition_id: Union[int,Dict], **kwargs) -> Dict:
         """Retrieves a list of files for a specific deposition from the Zenodo API. 
@@ -575,11 +1448,10 @@ class APIZenodo:
             APIResponseError: If the response status code indicates an error during the API request. 
         
         """ 
-        if isinstance(deposition_id, dict):
-            deposition_id = deposition_id['id']
-        url = f"{self.base_url}/api/deposit/depositions/{deposition_id}/files"
+        deposition_id = _extract_id(deposition_id)
+        url = f"{self._depositions_url}/{deposition_id}/files"
         response = self._req.get(url, **kwargs)
-        return response.json()
+        return _decode_json(response)
     
     def publish_deposition(self, deposition_id: Union[int,Dict], **kwargs) -> Dict:
         """Publishes a specific deposition on the Zenodo API. 
@@ -596,11 +1468,13 @@ class APIZenodo:
             APIResponseError: If the response status code indicates an error during the API request. 
         
         """ 
-        if isinstance(deposition_id, dict):
-            deposition_id = deposition_id['id']
-        url = f"{self.base_url}/api/deposit/depositions/{deposition_id}/actions/publish"
+        deposition_id = _extract_id(deposition_id)
+        self._buckets.pop(deposition_id, None)
+        url = f"{self._depositions_url}/{deposition_id}/actions/publish"
         response = self._req.post(url, **kwargs)
-        return response.json()
+        # Publishing creates or updates records
+        self._records.clear()
+        return _decode_json(response)
     
     def edit_deposition(self, deposition_id: Union[int,Dict], **kwargs) -> Dict:
         """Sets a specific deposition to the "edit" state on the Zenodo API. 
@@ -617,11 +1491,11 @@ class APIZenodo:
             APIResponseError: If the response status code indicates an error during the API request. 
         
         """ 
-        if isinstance(deposition_id, dict):
-            deposition_id = deposition_id['id']
-        url = f"{self.base_url}/api/deposit/depositions/{deposition_id}/actions/edit"
+        deposition_id = _extract_id(deposition_id)
+        self._buckets.pop(deposition_id, None)
+        url = f"{self._depositions_url}/{deposition_id}/actions/edit"
         response = self._req.post(url, **kwargs)
-        return response.json()
+        return _decode_json(response)
     
     def discard_deposition(self, deposition_id: Union[int,Dict], **kwargs) -> Dict:
         """Discards changes of a specific deposition on the Zenodo API. 
@@ -638,11 +1512,11 @@ class APIZenodo:
             APIResponseError: If the response status code indicates an error during the API request. 
         
         """ 
-        if isinstance(deposition_id, dict):
-            deposition_id = deposition_id['id']
-        url = f"{self.base_url}/api/deposit/depositions/{deposition_id}/actions/discard"
+        deposition_id = _extract_id(deposition_id)
+        self._buckets.pop(deposition_id, None)
+        url = f"{self._depositions_url}/{deposition_id}/actions/discard"
         response = self._req.post(url, **kwargs)
-        return response.json()
+        return _decode_json(response)
     
     def new_version_deposition(self, deposition_id: Union[int,Dict], **kwargs) -> Dict:
         """Creates a new version of a specific deposition on the Zenodo API. Unlike Zenodo API, this 
@@ -660,23 +1534,25 @@ class APIZenodo:
             APIResponseError: If the response status code indicates an error during the API request. 
         
         """ 
-        if isinstance(deposition_id, dict):
-            deposition_id = deposition_id['id']
-        url = f"{self.base_url}/api/deposit/depositions/{deposition_id}/actions/newversion"
-        response = self._req.post(url, **kwargs).json()
+        deposition_id = _extract_id(deposition_id)
+        self._buckets.pop(deposition_id, None)
+        url = f"{self._depositions_url}/{deposition_id}/actions/newversion"
+        response = _decode_json(self._req.post(url, **kwargs))
         last_draft_url = response['links']['latest_draft']
         response = self._req.get(last_draft_url, **kwargs)
-        return response.json()
+        return _decode_json(response)
     
     def create_deposition_file(self, deposition_id: Union[int,Dict], filename: str, \
-        bucket_filename: Optional[str]=None, **kwargs) -> Dict:
+        bucket_filename: Optional[str]=None, chunk_size: int=1 << 23, **kwargs) -> Dict:
         """Creates a new file for a specific deposition on the Zenodo API. 
     
         Args: 
             deposition_id (Union[int,Dict]): The ID of the deposition to create the file for, or a 
                 dictionary containing the deposition information. 
-            filename (str): The local file path of the file to upload. 
+            filename (str): The local file path of the file to upload, or the URL of a remote file. 
+                Remote files are streamed from their server straight to the deposition's bucket. 
             bucket_filename (str or None): The desired filename for the file in the deposition's bucket. 
+            chunk_size (int=8388608): The number of bytes read from the file and sent at a time. 
             **kwargs: Additional keyword arguments for the API request. 
     
         Returns: 
@@ -687,15 +1563,132 @@ class APIZenodo:
             APIResponseError: If the response status code indicates an error during the API request. 
         
         """ 
+        if filename.startswith(__utils__.valid_schemas):
+            bucket_url = self.get_deposition_bucket(deposition_id)
+            return self._put_bucket_url(bucket_url, filename, bucket_filename, chunk_size, **kwargs)
         if not os.path.isfile(filename):
             raise ValueError(f"File '{filename}' does not exist")
         bucket_url = self.get_deposition_bucket(deposition_id)
+        return self._put_bucket_file(bucket_url, filename, bucket_filename, chunk_size, **kwargs)
+    
+    def create_deposition_files(self, deposition_id: Union[int,Dict], filenames: List[str], 
+                                max_workers: int=8, chunk_size: int=1 << 23, 
+                                **kwargs) -> List[Dict]:
+        """Creates new files for a specific deposition on the Zenodo API, uploading them in parallel. 
+    
+        Args: 
+            deposition_id (Union[int,Dict]): The ID of the deposition to create the files for, or a 
+                dictionary containing the deposition information. 
+            filenames (List[str]): The local file paths (or URLs of remote files) of the files to 
+                upload. Each file is stored in the deposition's bucket under its base name. Remote 
+                files are streamed from their server straight to the bucket. 
+            max_workers (int=8): The maximum number of files uploaded at the same time. 
+            chunk_size (int=8388608): The number of bytes read from each file and sent at a time. 
+            **kwargs: Additional keyword arguments for the API requests. 
+    
+        Returns: 
+            List[dict]: The response JSON of each newly created file, in the order of `filenames`. 
+    
+        Raises: 
+            ValueError: If any of the specified files does not exist. 
+            APIResponseError: If the response status code indicates an error during the API request. 
+        
+        """ 
+        for filename in filenames:
+            if not filename.startswith(__utils__.valid_schemas) and not os.path.isfile(filename):
+                raise ValueError(f"File '{filename}' does not exist")
+        bucket_url = self.get_deposition_bucket(deposition_id)
+        def upload(filename: str) -> Dict:
+            if filename.startswith(__utils__.valid_schemas):
+                return self._put_bucket_url(bucket_url, filename, None, chunk_size, **kwargs)
+            return self._put_bucket_file(bucket_url, filename, None, chunk_size, **kwargs)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(upload, filenames))
+    
+    async def create_deposition_files_async(self, session: aiohttp.ClientSession, 
+                                            deposition_id: Union[int,Dict], filenames: List[str], 
+                                            concurrency: int=8, **kwargs) -> List[Dict]:
+        """Creates new files for a specific deposition on the Zenodo API using an `aiohttp` session. 
+        
+        The files are uploaded at the same time, with up to `concurrency` uploads in flight. 
+    
+        Args: 
+            session (aiohttp.ClientSession): The session used to send the requests. 
+            deposition_id (Union[int,Dict]): The ID of the deposition to create the files for, or a 
+                dictionary containing the deposition information. 
+            filenames (List[str]): The local file paths of the files to upload. Each file is stored 
+                in the deposition's bucket under its base name. 
+            concurrency (int=8): The maximum number of files uploaded at the same time. 
+            **kwargs: Additional keyword arguments for the API requests. 
+    
+        Returns: 
+            List[dict]: The response JSON of each newly created file, in the order of `filenames`. 
+    
+        Raises: 
+            ValueError: If any of the specified files does not exist. 
+            APIResponseError: If the response status code indicates an error during the API request. 
+        
+        """ 
+        for filename in filenames:
+            if not os.path.isfile(filename):
+                raise ValueError(f"File '{filename}' does not exist")
+        if not isinstance(deposition_id, dict) or 'links' not in deposition_id or \
+            'bucket' not in deposition_id['links']:
+            deposition_id = await self.retrieve_deposition_async(session, deposition_id)
+        bucket_url = deposition_id['links']['bucket']
+        semaphore = asyncio.Semaphore(concurrency)
+        async def upload(filename: str) -> Dict:
+            url = f"{bucket_url}/{os.path.basename(filename)}"
+            async with semaphore:
+                with open(filename, 'rb') as file_data:
+                    response = await self._req._request_async(session, 'PUT', url, 
+                                                              data=file_data, **kwargs)
+            return _decode_json(response)
+        return list(await asyncio.gather(*[upload(filename) for filename in filenames]))
+    
+    def _put_bucket_file(self, bucket_url: str, filename: str, 
+                         bucket_filename: Optional[str]=None, chunk_size: int=1 << 23, 
+                         **kwargs) -> Dict:
         if bucket_filename is None:
             bucket_filename = os.path.basename(filename)
         url = f"{bucket_url}/{bucket_filename}"
         with open(filename, 'rb') as file_data:
-            response = self._req.put(url, data=file_data, **kwargs)
-        return response.json()
+            body = _UploadBody(file_data, os.fstat(file_data.fileno()).st_size, chunk_size)
+            response = self._req.put(url, data=body, **kwargs)
+        return _decode_json(response)
+    
+    def _put_bucket_url(self, bucket_url: str, file_url: str, 
+                        bucket_filename: Optional[str]=None, chunk_size: int=1 << 23, 
+                        **kwargs) -> Dict:
+        if bucket_filename is None:
+            bucket_filename = os.path.basename(urlparse(file_url).path)
+        url = f"{bucket_url}/{bucket_filename}"
+        # A stalled source server must not hang the upload, so the API timeouts also apply here
+        timeout = kwargs.get('timeout', self._timeout)
+        with __utils__.http_session().get(file_url, stream=True, timeout=timeout) as source:
+            source.raise_for_status()
+            size = source.headers.get('Content-Length')
+            encoding = source.headers.get('Content-Encoding', 'identity')
+            if size is not None and encoding == 'identity':
+                # The raw stream can be passed through as is: its length is known and bytes need 
+                # no decoding.
+                body = _UploadBody(source.raw, int(size), chunk_size)
+                try:
+                    return _decode_json(self._req.put(url, data=body, **kwargs))
+                except UnrewindableBodyError:
+                    # The upload has to be retried, but the raw stream cannot be rewound. The 
+                    # file is downloaded again and spooled below instead.
+                    pass
+        with __utils__.http_session().get(file_url, stream=True, timeout=timeout) as source:
+            source.raise_for_status()
+            # The decoded content is spooled to an anonymous temporary file, which can be 
+            # rewound if the upload is retried
+            source.raw.decode_content = True
+            with tempfile.TemporaryFile() as file_data:
+                shutil.copyfileobj(source.raw, file_data, 1 << 20)
+                body = _UploadBody(file_data, file_data.tell(), chunk_size)
+                file_data.seek(0)
+                return _decode_json(self._req.put(url, data=body, **kwargs))
     
     def sort_deposition_files(self, deposition_id: Union[int,Dict], 
                               file_id_list: List[Union[str,Dict]], **kwargs) -> Dict:
@@ -717,12 +1710,11 @@ class APIZenodo:
         """ 
         if not isinstance(file_id_list, list):
             raise ValueError('Invalid file_id_list parameter: value should be a list')
-        if isinstance(deposition_id, dict):
-            deposition_id = deposition_id['id']
-        file_id_list = [{'id': v['id']} for v in file_id_list]
-        url = f"{self.base_url}/api/deposit/depositions/{deposition_id}/files"
+        deposition_id = _extract_id(deposition_id)
+        file_id_list = [{'id': _extract_id(v)} for v in file_id_list]
+        url = f"{self._depositions_url}/{deposition_id}/files"
         response = self._req.put(url, json=file_id_list, **kwargs)
-        return response.json()
+        return _decode_json(response)
     
     def retrieve_deposition_file(self, file_id: Union[str,Dict], **kwargs) -> Dict:
         """Retrieves a specific file of a deposition from the Zenodo API. 
@@ -740,10 +1732,32 @@ class APIZenodo:
                 request. 
         
         """ 
-        if isinstance(file_id, dict):
-            file_id = file_id['links']['self']
+        file_id = _extract_id(file_id, 'links', 'self')
         response = self._req.get(file_id, **kwargs)
-        return response.json()
+        return _decode_json(response)
+    
+    def retrieve_deposition_files(self, file_ids: List[Union[str,Dict]], max_workers: int=8, 
+                                  **kwargs) -> List[Dict]:
+        """Retrieves several files of a deposition from the Zenodo API in parallel. 
+    
+        Args: 
+            file_ids (List[Union[str,Dict]]): The IDs of the files to retrieve, or dictionaries 
+                containing the files information. 
+            max_workers (int=8): The maximum number of files retrieved at the same time. 
+            **kwargs: Additional keyword arguments for the API requests. 
+    
+        Returns: 
+            List[dict]: The response JSON of each file, in the order of `file_ids`. 
+    
+        Raises: 
+            APIResponseError: If the response status code indicates an error during the API 
+                request. 
+        
+        """ 
+        def retrieve(file_id: Union[str,Dict]) -> Dict:
+            return self.retrieve_deposition_file(file_id, **kwargs)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(retrieve, file_ids))
     
     def delete_deposition_file(self, file_id: Union[str,Dict], **kwargs) -> None:
         """Deletes a specific file of a deposition from the Zenodo API. 
@@ -761,35 +1775,89 @@ class APIZenodo:
                 API request. 
         
         """ 
-        if isinstance(file_id, dict):
-            file_id = file_id['links']['self']
+        file_id = _extract_id(file_id, 'links', 'self')
         self._req.delete(file_id, **kwargs)
     
-    def checksum_deposition_file(self, file_id: Union[str,Dict], **kwargs) -> str:
+    def checksum_deposition_file(self, file_id: Union[str,Dict], local_file: Optional[str]=None, 
+                                 **kwargs) -> str:
         """Retrieves the checksum of a specific file of a deposition from the Zenodo API. 
         
         Args: 
             file_id (Union[str,Dict]): The ID of the file to retrieve the checksum for, or a dictionary 
                 containing the file information. 
+            local_file (Optional[str]=None): The path to a local copy of the file. If provided, the 
+                MD5 checksum is calculated from the local file, without sending any request. 
             **kwargs: Additional keyword arguments for the API request. 
         
         Returns: 
             str: The checksum of the file. 
         
         Raises: 
+            ValueError: If `local_file` is not a valid file. 
             APIResponseError: If the response status code indicates an error during the 
                 API request. 
         
         """ 
+        if local_file is not None:
+            if not os.path.isfile(local_file):
+                raise ValueError(f"File '{local_file}' does not exist")
+            return __utils__.checksum(local_file, 'md5')
         if not isinstance(file_id, dict) or 'checksum' not in file_id:
             file_id = self.retrieve_deposition_file(file_id, **kwargs)
         if file_id['checksum'].startswith('md5:'):
             return file_id['checksum'][4:]
         return file_id['checksum']
     
+    def checksum_deposition_files(self, file_ids: List[Union[str,Dict]], max_workers: int=8, 
+                                  **kwargs) -> List[str]:
+        """Retrieves the checksums of several files of a deposition from the Zenodo API. 
+        
+        Only the files given without checksum information are retrieved, in parallel. To verify 
+        all files of a deposition, pass the result of `list_deposition_files()`, which already 
+        includes the checksums, so that no further request is sent. 
+        
+        Args: 
+            file_ids (List[Union[str,Dict]]): The IDs of the files to retrieve the checksums for, 
+                or dictionaries containing the files information. 
+            max_workers (int=8): The maximum number of files retrieved at the same time. 
+            **kwargs: Additional keyword arguments for the API requests. 
+        
+        Returns: 
+            List[str]: The checksum of each file, in the order of `file_ids`. 
+        
+        Raises: 
+            APIResponseError: If the response status code indicates an error during the 
+                API request. 
+        
+        """ 
+        files = list(file_ids)
+        missing = [i for i, file in enumerate(files) 
+                   if not isinstance(file, dict) or 'checksum' not in file]
+        if missing:
+            retrieved = self.retrieve_deposition_files([files[i] for i in missing], max_workers, 
+                                                       **kwargs)
+            for i, file in zip(missing, retrieved):
+                files[i] = file
+        return [self.checksum_deposition_file(file) for file in files]
+    
     @property
     def request(self) -> _APIRequest:
         return self._req
+    
+    def close(self) -> None:
+        """Closes the connections used to send the API requests. 
+        
+        The session given in the constructor, if any, is left open. The connection pools shared 
+        by the default sessions are closed when the last instance using them is closed. 
+        
+        """ 
+        self._req.close()
+    
+    def __enter__(self) -> Self:
+        return self
+    
+    def __exit__(self, *args) -> None:
+        self.close()
 
 
 class Depositions:
@@ -826,6 +1894,14 @@ class Depositions:
         
         >>> existing_dep = zen.depositions.retrieve(new_dep.id)
         >>> new_dep.discard()  # Cancel deposition creation
+        
+        5. Iterating over depositions without retrieving all of them at once:
+        
+        >>> first_draft = next(zen.depositions.iter(status='draft'))
+        
+        6. Retrieving many depositions with a few requests:
+        
+        >>> deps = zen.depositions.retrieve_many([123456, 234567, 345678])
     
     """ 
     status_options = ['draft', 'published']
@@ -835,8 +1911,31 @@ class Depositions:
     def __init__(self, api: Zenodo) -> None:
         self._api = api
     
+    @staticmethod
+    def _query(q: Optional[str]=None, status: Optional[str]=None, sort: Optional[str]=None, 
+               size: Optional[int]=None, all_versions: Optional[bool]=None) -> Dict[str,Any]:
+        if status is not None and not status in Depositions.status_options:
+            raise ValueError('Invalid `status` parameter. Please, see `Depositions.status_options` ' +
+                             'attribute for supported options.')
+        if sort is not None and not sort in Depositions.sort_options:
+            raise ValueError('Invalid `sort` parameter. Please, see `Depositions.sort_options` ' +
+                             'attribute for supported options.')
+        # Builds the query
+        query = (('q', q), ('status', status), ('sort', sort), ('size', size), 
+                 ('all_versions', all_versions))
+        return {k: v for k, v in query if v is not None}
+    
+    @staticmethod
+    def _page_size(size: Optional[int], first_page: List[Dict[str,Any]]) -> int:
+        # The server may cap the page size below the requested one, so the first page is the 
+        # reference: any shorter page afterwards is the last one
+        if size is None:
+            return len(first_page)
+        return min(size, len(first_page))
+    
     def list(self, q: Optional[str]=None, status: Optional[str]=None, sort: Optional[str]=None, 
-             size: Optional[int]=None, all_versions: Optional[bool]=None) -> List[Deposition]:
+             size: Optional[int]=None, all_versions: Optional[bool]=None, 
+             max_workers: int=8) -> List[Deposition]:
         """Retrieve a list of depositions from Zenodo.
         
         This method searches depositions associated with current Zenodo account (determined by 
@@ -844,6 +1943,10 @@ class Depositions:
         on specific criteria, including search terms, status, sorting options, and the maximum 
         number of depositions to retrieve.
         
+        After the first page, the following pages are requested in parallel until an incomplete 
+        page is found. The batches start with a single page and double in size up to 
+        `max_workers` pages, so that few depositions cost few requests.
+        
         Args: 
             q (Optional[str]=None): The Elasticsearch query to filter the depositions. 
             status (Optional[str]=None): The status of the depositions to filter. See 
@@ -853,29 +1956,176 @@ class Depositions:
             size (Optional[int]=None): The maximum number of depositions to retrieve. 
             all_versions (Optional[bool]=None): Whether to include all versions of the 
                 depositions. 
+            max_workers (int=8): The maximum number of pages requested at the same time.
         
         Returns: 
             List[Deposition]: A list of Deposition objects representing the retrieved depositions. 
         
         """ 
-        if status is not None and not status in Depositions.status_options:
-            raise ValueError('Invalid `status` parameter. Please, see `Depositions.status_options` ' +
-                             'attribute for supported options.')
-        if sort is not None and not sort in Depositions.sort_options:
-            raise ValueError('Invalid `sort` parameter. Please, see `Depositions.sort_options` ' +
-                             'attribute for supported options.')
-        # Builds the query
-        query = dict(q=q, status=status, sort=sort, size=size, all_versions=all_versions)
-        query = {k: v for k, v in query.items() if v is not None}
-        # Prepare for pagination
-        items = []
-        page_results = self._api.api.list_depositions(query)
-        while len(page_results) > 0:
-            items.extend(page_results)
-            if 'page' not in query:
-                query['page'] = 1
-            query.update(dict(page=query['page'] + 1))
-            page_results = self._api.api.list_depositions(query)
+        query = Depositions._query(q, status, sort, size, all_versions)
+        api = self._api.api
+        def fetch(page: int) -> List[Dict[str,Any]]:
+            return api.list_depositions(dict(query, page=page))
+        items = api.list_depositions(query)
+        page_size = Depositions._page_size(size, items)
+        page = 2
+        batch = 1
+        done = len(items) == 0
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            while not done:
+                pages = range(page, page + batch)
+                for page_results in executor.map(fetch, pages):
+                    items.extend(page_results)
+                    if len(page_results) < page_size:
+                        done = True
+                        break
+                page += batch
+                batch = min(2 * batch, max_workers)
+        return [__dataset__.Deposition(self._api, item) for item in items]
+    
+    def iter(self, q: Optional[str]=None, status: Optional[str]=None, sort: Optional[str]=None, 
+             size: Optional[int]=None, all_versions: Optional[bool]=None) -> Iterator[Deposition]:
+        """Iterate over depositions from Zenodo, requesting pages on demand.
+        
+        Unlike `list()`, this method does not retrieve all depositions beforehand. Each page is 
+        requested only when the previous one has been consumed, so stopping the iteration early 
+        saves the requests of the remaining pages. The iteration ends at the first page shorter 
+        than the first one, or at an empty page.
+        
+        Args: 
+            q (Optional[str]=None): The Elasticsearch query to filter the depositions. 
+            status (Optional[str]=None): The status of the depositions to filter. See 
+                `status_options` attribute for supported options.
+            sort (Optional[str]=None): The field to sort the depositions by. See `sort_options` 
+                attribute for supported options.
+            size (Optional[int]=None): The maximum number of depositions to retrieve per page. 
+            all_versions (Optional[bool]=None): Whether to include all versions of the 
+                depositions. 
+        
+        Returns: 
+            Iterator[Deposition]: An iterator that yields each retrieved deposition. 
+        
+        Examples:
+        
+            >>> for dep in zen.depositions.iter(status='draft'):
+            ...     if dep.title == 'My title':
+            ...         break
+        
+        """ 
+        query = Depositions._query(q, status, sort, size, all_versions)
+        def _iter() -> Iterator[Deposition]:
+            page = 1
+            page_size = None
+            while True:
+                page_results = self._api.api.list_depositions(dict(query, page=page))
+                for item in page_results:
+                    yield __dataset__.Deposition(self._api, item)
+                if page_size is None:
+                    page_size = Depositions._page_size(size, page_results)
+                if len(page_results) == 0 or len(page_results) < page_size:
+                    return
+                page += 1
+        return _iter()
+    
+    async def list_async(self, q: Optional[str]=None, status: Optional[str]=None, 
+                         sort: Optional[str]=None, size: Optional[int]=None, 
+                         all_versions: Optional[bool]=None, 
+                         concurrency: int=16) -> List[Deposition]:
+        """Retrieve a list of depositions from Zenodo, fetching pages concurrently.
+        
+        This coroutine is the asynchronous counterpart of `list()`. Instead of requesting one 
+        page after the other, it requests pages in batches that double in size up to 
+        `concurrency` pages at the same time, and stops at the first incomplete page. It 
+        requires the `aiohttp` package.
+        
+        Args: 
+            q (Optional[str]=None): The Elasticsearch query to filter the depositions. 
+            status (Optional[str]=None): The status of the depositions to filter. See 
+                `status_options` attribute for supported options.
+            sort (Optional[str]=None): The field to sort the depositions by. See `sort_options` 
+                attribute for supported options.
+            size (Optional[int]=None): The maximum number of depositions to retrieve. 
+            all_versions (Optional[bool]=None): Whether to include all versions of the 
+                depositions. 
+            concurrency (int=16): The maximum number of pages requested at the same time.
+        
+        Returns: 
+            List[Deposition]: A list of Deposition objects representing the retrieved depositions. 
+        
+        Raises:
+            ImportError: If `aiohttp` package is not installed.
+        
+        Examples:
+        
+            >>> import asyncio
+            >>> deps = asyncio.run(zen.depositions.list_async(status='draft'))
+        
+        """ 
+        if aiohttp is None:
+            raise ImportError("Package 'aiohttp' is required by `list_async()`. Please, install " +
+                              "it using `pip install aiohttp`.")
+        query = Depositions._query(q, status, sort, size, all_versions)
+        api = self._api.api
+        connector = aiohttp.TCPConnector(limit_per_host=64)
+        async with aiohttp.ClientSession(connector=connector) as session:
+            semaphore = asyncio.Semaphore(concurrency)
+            async def fetch(page: int) -> List[Dict[str,Any]]:
+                async with semaphore:
+                    return await api.list_depositions_async(session, dict(query, page=page))
+            items = await fetch(1)
+            page_size = Depositions._page_size(size, items)
+            page = 2
+            batch = 1
+            done = len(items) == 0
+            while not done:
+                pages = range(page, page + batch)
+                results = await asyncio.gather(*[fetch(p) for p in pages])
+                for page_results in results:
+                    items.extend(page_results)
+                    if len(page_results) < page_size:
+                        done = True
+                        break
+                page += batch
+                batch = min(2 * batch, concurrency)
+        return [__dataset__.Deposition(self._api, item) for item in items]
+    
+    async def gather(self, depositions: List[Union[Deposition,Dict[str,Any],int]], 
+                     concurrency: int=16) -> List[Deposition]:
+        """Retrieves several depositions from Zenodo at the same time.
+        
+        This coroutine sends one request per deposition, with up to `concurrency` requests in 
+        flight, in a single event loop pass. It requires the `aiohttp` package.
+        
+        Args: 
+            depositions (List[Union[Deposition,Dict[str,Any],int]]): The IDs of the depositions 
+                to retrieve, or dictionaries containing the deposition information. 
+            concurrency (int=16): The maximum number of depositions requested at the same time.
+        
+        Returns: 
+            List[Deposition]: The retrieved depositions, in the same order as the provided IDs. 
+        
+        Raises:
+            ImportError: If `aiohttp` package is not installed.
+        
+        Examples:
+        
+            >>> import asyncio
+            >>> deps = asyncio.run(zen.depositions.gather([123456, 234567]))
+        
+        """ 
+        if aiohttp is None:
+            raise ImportError("Package 'aiohttp' is required by `gather()`. Please, install " +
+                              "it using `pip install aiohttp`.")
+        api = self._api.api
+        connector = aiohttp.TCPConnector(limit_per_host=64)
+        async with aiohttp.ClientSession(connector=connector) as session:
+            semaphore = asyncio.Semaphore(concurrency)
+            async def fetch(deposition: Union[Deposition,Dict[str,Any],int]) -> Dict[str,Any]:
+                if isinstance(deposition, __dataset__.Deposition):
+                    deposition = deposition.id
+                async with semaphore:
+                    return await api.retrieve_deposition_async(session, deposition)
+            items = await asyncio.gather(*[fetch(dep) for dep in depositions])
         return [__dataset__.Deposition(self._api, item) for item in items]
     
     def create(self, metadata: Optional[Union[Metadata,Dict[str,Any]]]=None) -> Deposition:
@@ -914,9 +2164,67 @@ class Depositions:
             deposition = deposition.id
         data = self._api.api.retrieve_deposition(deposition)
         return __dataset__.Deposition(self._api, data)
+    
+    def retrieve_many(self, depositions: List[Union[Deposition,Dict[str,Any],int]], 
+                      chunk: int=50, max_workers: int=8) -> List[Deposition]:
+        """Retrieves many depositions from the Zenodo API at once.
+        
+        Instead of one request per deposition, the IDs are searched in groups of `chunk` 
+        depositions using a query like `id:(id1 OR id2 OR ...)`, including all versions. The 
+        groups are requested in parallel. IDs missing from the search results (e.g. when the 
+        server returns fewer results than requested) are retrieved one by one.
+        
+        Args: 
+            depositions (List[Union[Deposition,Dict[str,Any],int]]): The IDs of the depositions 
+                to retrieve, or dictionaries containing the deposition information. 
+            chunk (int=50): The maximum number of depositions searched by request. 
+            max_workers (int=8): The maximum number of requests sent at the same time.
+        
+        Returns: 
+            List[Deposition]: The retrieved depositions, in the same order as the provided IDs. 
+                Repeated IDs are returned only once and IDs not found are ignored. 
+        
+        """ 
+        if not isinstance(chunk, int) or chunk < 1:
+            raise ValueError('Invalid `chunk` parameter. Expecting a positive `int` but got ' +
+                             f'{chunk} instead.')
+        ids = []
+        for deposition in depositions:
+            if isinstance(deposition, __dataset__.Deposition):
+                deposition = deposition.id
+            elif isinstance(deposition, dict):
+                deposition = deposition['id']
+            ids.append(int(deposition))
+        ids = list(dict.fromkeys(ids))
+        api = self._api.api
+        def fetch(chunk_ids: List[int]) -> List[Dict[str,Any]]:
+            # A chunk never has more results than its size, so a single page is requested
+            q = 'id:(' + ' OR '.join(map(str, chunk_ids)) + ')'
+            query = Depositions._query(q=q, size=len(chunk_ids), all_versions=True)
+            return api.list_depositions(query)
+        def fetch_one(id: int) -> Optional[Dict[str,Any]]:
+            try:
+                return api.retrieve_deposition(id)
+            except APIResponseError as e:
+                if e.status_code == 404:
+                    return None
+                raise
+        chunks = [ids[i:i + chunk] for i in range(0, len(ids), chunk)]
+        found = dict()
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for items in executor.map(fetch, chunks):
+                found.update({item['id']: item for item in items})
+            # The search may miss depositions, e.g. if the server caps the page size
+            missing = [id for id in ids if id not in found]
+            for id, item in zip(missing, executor.map(fetch_one, missing)):
+                if item is not None:
+                    found[id] = item
+        return [__dataset__.Deposition(self._api, found[id]) for id in ids if id in found]
 
 
 class License(dict):
+    __slots__ = ()
+    
     def __init__(self, data: Dict[str,Any]) -> None:
         super().__init__(data)
     
@@ -925,15 +2233,16 @@ class License(dict):
 
 
 class _PagedData:
+    __slots__ = ('_start_page', '_api', '_page', '_num_pages')
+    
     def __init__(self, page: Dict[str,Any], api: Zenodo) -> None:
         self._start_page = page
         self._api = api
-        self._pages_iter: Iterator[Dict[str,Any]] = None
         self._page: Dict[str,Any] = None
         self._num_pages = 0
         self.first_page()
         if len(self) > 0:
-            self._num_pages = self.total / len(self)
+            self._num_pages = ceil(self.total / len(self))
     
     def __repr__(self) -> str:
         items = [item['id'] for item in self.data['hits']['hits']]
@@ -953,20 +2262,20 @@ class _PagedData:
         return item
     
     def first_page(self) -> Self:
-        self._pages_iter = self._api.api.iter_pagination(self._start_page, limit=1)
-        self._page = next(self._pages_iter)
+        self._page = self._start_page
         return self
     
     def next_page(self) -> Self:
-        if self._pages_iter is None:
-            self._pages_iter = self._api.api.iter_pagination(self._start_page, limit=1)
-        self._page = next(self._pages_iter)
+        url = self.data.get('links', {}).get('next')
+        if url is None:
+            raise StopIteration('There is no next page.')
+        self._page = _decode_json(self._api.api.request.get(url))
         return self
     
     @property
     def data(self) -> Dict[str,Any]:
         if self._page is None:
-            self.next_page()
+            self.first_page()
         return self._page
     
     @property
@@ -980,15 +2289,43 @@ class _PagedData:
     @property
     def pages(self) -> Iterator[Dict[str,Any]]:
         yield self.first_page()
-        while True:
+        while 'next' in self.data.get('links', {}):
             yield self.next_page()
     
     @property
     def num_pages(self) -> int:
         return self._num_pages
+    
+    def prefetch_all(self, max_workers: int=8) -> List[Self]:
+        """Retrieves all pages, from the start page to the last one.
+        
+        The number of pages is known from the start page, so the remaining pages are requested 
+        in parallel instead of following the 'next' links one by one.
+        
+        Args:
+            max_workers (int=8): The maximum number of pages requested at the same time.
+        
+        Returns:
+            List[Self]: The pages, in order.
+        
+        """
+        start_page = self._start_page
+        if self._num_pages <= 1 or 'self' not in start_page.get('links', {}):
+            return [type(self)(start_page, self._api)]
+        parts = urlparse(start_page['links']['self'])
+        query = dict(parse_qsl(parts.query, keep_blank_values=True))
+        start = int(query.get('page', 1))
+        def fetch(page: int) -> Dict[str,Any]:
+            url = urlunparse(parts._replace(query=urlencode(dict(query, page=page))))
+            return _decode_json(self._api.api.request.get(url))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            pages = [start_page] + list(executor.map(fetch, range(start + 1, self._num_pages + 1)))
+        return [type(self)(page, self._api) for page in pages]
 
 
 class LicensesPage(_PagedData):
+    __slots__ = ()
+    
     def __init__(self, page: Dict[str,Any], api: Zenodo) -> None:
         super().__init__(page, api)
     
@@ -1002,8 +2339,14 @@ class Licenses:
     The Vocabularies class implements `vocabularies` endpoint of the Zenodo API. This class is 
     used by the `Zenodo` class to perform vocabularies queries on Zenodo API.
     
+    Licenses rarely change, so the retrieved licenses are kept in a local cache for up to a 
+    day (license entries) or an hour (license lists).
+    
     Args:
         api (Zenodo): The Zenodo instance used to interact with Zenodo API.
+        cache (Optional[SimpleCache]=None): The cache used to store retrieved licenses. If not 
+            provided, a cache is created at '~/.cache/zen'. To disable caching, pass a cache 
+            without entry types, i.e. `SimpleCache(ttl_config={})`.
     
     Examples:
         
@@ -1020,10 +2363,17 @@ class Licenses:
         3. Retrieving a Zenodo license:
         
         >>> zen.vocabularies.retrieve(type='license', id='cc-zero')
+        
+        4. Retrieving all licenses at once:
+        
+        >>> licenses = zen.licenses.list_all(q='cc')
     
     """ 
-    def __init__(self, api: Zenodo) -> None:
+    def __init__(self, api: Zenodo, cache: Optional[__cache__.SimpleCache]=None) -> None:
         self._api = api
+        if cache is None:
+            cache = __cache__.SimpleCache()
+        self._cache = cache
     
     def list(self, q: Optional[str]=None, page: Optional[int]=None, 
              size: Optional[int]=None) -> LicensesPage:
@@ -1043,12 +2393,34 @@ class Licenses:
         
         """ 
         # Builds the query
-        query = dict(q=q, page=page, size=size)
-        query = {k: v for k, v in query.items() if v is not None}
+        query = {k: v for k, v in (('q', q), ('page', page), ('size', size)) if v is not None}
         # Prepare for pagination
-        page_results = self._api.api.list_licenses(query)
+        params = dict(query, base_url=self._api.api.base_url)
+        page_results = self._cache.get('licenses_list', params)
+        if page_results is None:
+            page_results = self._api.api.list_licenses(query)
+            self._cache.set('licenses_list', params, page_results)
         return LicensesPage(page_results, self._api)
     
+    def list_all(self, q: Optional[str]=None, size: Optional[int]=100, 
+                 max_workers: int=8) -> List[License]:
+        """Retrieve all licenses matching a query from Zenodo.
+        
+        The first page gives the total number of licenses, so all the remaining pages are 
+        requested in parallel, in up to `max_workers` requests at the same time.
+        
+        Args: 
+            q (Optional[str]=None): The Elasticsearch query to filter the licenses.
+            size (Optional[int]=100): The maximum number of licenses to retrieve per page.
+            max_workers (int=8): The maximum number of pages requested at the same time.
+        
+        Returns: 
+            List[License]: The licenses of all pages, in order. 
+        
+        """ 
+        first_page = self.list(q=q, size=size)
+        return [license for page in first_page.prefetch_all(max_workers) for license in page]
+    
     def retrieve(self, license: Union[Dict[str,Any],int]) -> License:
         """Retrieves a specific license from the Zenodo API.
         
@@ -1060,9 +2432,12 @@ class Licenses:
             License: A License object representing the retrieved license. 
         
         """ 
-        if isinstance(license, dict):
-            license = license.id
-        data = self._api.api.retrieve_license(license)
+        license = _extract_id(license)
+        params = dict(id=license, base_url=self._api.api.base_url)
+        data = self._cache.get('license', params)
+        if data is None:
+            data = self._api.api.retrieve_license(license)
+            self._cache.set('license', params, data)
         return License(data)
 
 
@@ -1086,6 +2461,30 @@ class Zenodo:
         token (Optional[str]=None): The access token for making authenticated requests to the 
             Zenodo API. 
         headers (Optional[Dict[str,str]]=None): Additional headers to include in API requests. 
+        session (Optional[requests.Session]=None): A custom session to send the API requests 
+            (e.g. with custom retry or timeout adapters mounted). Objects with the same interface 
+            as `requests.Session` are also accepted, including the `stream` argument of 
+            `request()` and the `raw` attribute of streamed responses. If not provided, a new 
+            session with a connection pool is created. 
+        rate_limit (Optional[int]=100): The maximum number of API requests per minute. Requests 
+            exceeding this rate wait before being sent. If `None`, requests are not rate limited. 
+        pool_size (int=25): The maximum number of connections kept open to the server. Increase 
+            it (e.g. to `Zenodo.max_deposition_files`) to send more requests in parallel. Ignored 
+            if `session` is provided. 
+        max_retries (int=5): The maximum number of retries of requests failed due to rate 
+            limiting (429) or transient server errors (5xx), waiting with exponential backoff (or 
+            as told by the 'Retry-After' header) between attempts. POST requests are not 
+            retried on 5xx errors, as they may have been processed. Ignored if `session` is 
+            provided.
+        connect_timeout (Optional[float]=10): The number of seconds to wait for a connection to 
+            the server, so that unreachable servers fail fast. If `None`, waits forever. 
+        read_timeout (Optional[float]=300): The number of seconds to wait for the server to send 
+            data (e.g. the response to a large upload). If `None`, waits forever. Both timeouts 
+            can be overridden per request with the `timeout` argument, and are ignored if 
+            `session` is not a `requests.Session`. 
+        cache_dir (Optional[str]='~/.cache/zen'): The directory where rarely changing API 
+            responses (e.g. licenses) are cached across sessions. If `None`, nothing is written 
+            to disk. 
     
     Examples:
         You can use the `Zenodo` class to interact with the Zenodo API:
@@ -1097,6 +2496,11 @@ class Zenodo:
         2. Access the `depositions` endpoint to list depositions:
         
         >>> deposition_list = zen.depositions.list(status='published')
+        
+        3. Use it as a context manager to close its connections when done:
+        
+        >>> with Zenodo(url=Zenodo.sandbox_url, token='your_access_token') as zen:
+        ...     deposition_list = zen.depositions.list(status='published')
     
     """ 
     url = 'https://zenodo.org'
@@ -1106,7 +2510,12 @@ class Zenodo:
     
     
     def __init__(self, url: str='https://zenodo.org', token: Optional[str]=None, 
-                 headers: Optional[Dict[str,str]]=None) -> None:
+                 headers: Optional[Dict[str,str]]=None, 
+                 session: Optional[requests.Session]=None, 
+                 rate_limit: Optional[int]=100, pool_size: int=25, 
+                 max_retries: int=5, connect_timeout: Optional[float]=10, 
+                 read_timeout: Optional[float]=300, 
+                 cache_dir: Optional[str]='~/.cache/zen') -> None:
         if not isinstance(url, str):
             raise TypeError('Invalid `url` parameter. Expecting a `str` but got a ' +
                             f'{type(url)} instead.')
@@ -1116,10 +2525,37 @@ class Zenodo:
         if headers is not None and not isinstance(headers, dict):
             raise TypeError('Invalid `headers` parameter. Expecting a `dict` but got a ' +
                             f'{type(headers)} instead.')
-        self._api = APIZenodo(url, token, headers)
+        if session is not None and not callable(getattr(session, 'request', None)):
+            raise TypeError('Invalid `session` parameter. Expecting a `requests.Session` compatible client ' +
+                            f'but got a {type(session)} instead.')
+        if rate_limit is not None and not isinstance(rate_limit, int):
+            raise TypeError('Invalid `rate_limit` parameter. Expecting an `int` but got a ' +
+                            f'{type(rate_limit)} instead.')
+        if not isinstance(pool_size, int) or pool_size < 1:
+            raise ValueError('Invalid `pool_size` parameter. Expecting a positive `int` but got ' +
+                             f'{pool_size} instead.')
+        if not isinstance(max_retries, int) or max_retries < 0:
+            raise ValueError('Invalid `max_retries` parameter. Expecting a non-negative `int` ' +
+                             f'but got {max_retries} instead.')
+        for name, value in (('connect_timeout', connect_timeout), ('read_timeout', read_timeout)):
+            if value is not None and (not isinstance(value, (int, float)) or value <= 0):
+                raise ValueError(f'Invalid `{name}` parameter. Expecting a positive number but ' +
+                                 f'got {value} instead.')
+        if cache_dir is not None and not isinstance(cache_dir, str):
+            raise TypeError('Invalid `cache_dir` parameter. Expecting a `str` but got a ' +
+                            f'{type(cache_dir)} instead.')
+        self._api = APIZenodo(url, token, headers=headers, session=session, 
+                              rate_limit=rate_limit, pool_size=pool_size, 
+                              max_retries=max_retries, connect_timeout=connect_timeout, 
+                              read_timeout=read_timeout)
         self._depositions = Depositions(self)
         self._records = None
-        self._licenses = Licenses(self)
+        if cache_dir is None:
+            # A cache without entry types never reads or writes any file
+            cache = __cache__.SimpleCache(ttl_config={})
+        else:
+            cache = __cache__.SimpleCache(cache_dir)
+        self._licenses = Licenses(self, cache)
     
     @property
     def api(self) -> APIZenodo:
@@ -1144,3 +2580,19 @@ class Zenodo:
         """The licenses endpoint.
         """ 
         return self._licenses
+    
+    def close(self) -> None:
+        """Closes the connections used to send the API requests.
+        
+        The session given in the constructor, if any, is left open. The connection pools shared 
+        with other `Zenodo` instances are closed when the last instance using them is closed. 
+        The object can still be used afterwards, in which case new connections are opened as 
+        needed.
+        """ 
+        self._api.close()
+    
+    def __enter__(self) -> Self:
+        return self
+    
+    def __exit__(self, *args) -> None:
+        self.close()
@@ -112,26 +112,39 @@ Note:
 
 """
 from __future__ import annotations
-from typing import List, Dict, Set, Callable, Iterator, Any, Union, Optional, TYPE_CHECKING
+from typing import Tuple, List, Dict, Set, Callable, Iterator, Any, Union, Optional, TYPE_CHECKING
 from typing_extensions import Self
 if TYPE_CHECKING:
     from .api import Zenodo
     from .metadata import Metadata
+from concurrent.futures import ThreadPoolExecutor
 from copy import copy, deepcopy
 from datetime import datetime
+from functools import lru_cache
 import zen.api as __api__
 import zen.metadata as __metadata__
 import zen.utils as __utils__
 import json
 import os
 import re
-import requests
+import threading
 import tqdm
 import time
 import random
 
 Zenodo = __api__.Zenodo
 
+
+@lru_cache(maxsize=8)
+def _cached_api(url: str, token: Optional[str], 
+                headers: Optional[Tuple[Tuple[str,str],...]]) -> Zenodo:
+    return Zenodo(url, token, dict(headers) if headers is not None else None)
+
+def _get_api(url: str, token: Optional[str], headers: Optional[Dict[str,str]]) -> Zenodo:
+    # Reuses the `Zenodo` objects with the same credentials, so that their connections, 
+    # cached responses, and rate limiter are shared across calls.
+    return _cached_api(url, token, tuple(sorted(headers.items())) if headers else None)
+
 class BaseFile(dict):
     """Base Class for Representing Files with Associated Metadata.
     
@@ -149,6 +162,8 @@ class BaseFile(dict):
         file (Union[Dict[str,Any],str]): The dictionary representing a file or a file path.
     
     """
+    __slots__ = ()
+    
     def __init__(self, file: Union[Dict[str,Any],str]) -> None:
         if isinstance(file, str):
             if len(file) == 0:
@@ -252,6 +267,8 @@ class LocalFile(BaseFile):
         file1.csv
     
     """
+    __slots__ = ()
+    
     def __init__(self, file: Union[Dict[str,Any],str]) -> None:
         super().__init__(file)
     
@@ -294,7 +311,7 @@ class LocalFile(BaseFile):
         if self.is_remote:
             filesize = None
             filedate = None
-            response = requests.head(self.url)
+            response = __utils__.http_session().head(self.url)
             response.raise_for_status()
             content_length = response.headers.get('Content-Length')
             if content_length:
@@ -324,6 +341,10 @@ class LocalFile(BaseFile):
         Args:
             deposition (Deposition): The deposition to where upload the file.
             force (bool=False): Should the file be uploaded regardless it already been uploaded?
+            max_retries (int=15): The maximum number of upload attempts.
+            min_delay (int=10): The lower bound (in seconds) of the delay between retries. The 
+                delay is drawn at random above it, up to a limit that doubles at each attempt.
+            max_delay (int=60): The upper bound (in seconds) of the delay between retries.
 
         Returns:
             LocalFile: The uploaded file with its updated metadata.
@@ -336,11 +357,11 @@ class LocalFile(BaseFile):
             url = self.url
             tempfile = None
             self.update_metadata()
-            print(f'Processing file: {url}')
+            # Written through tqdm, so lines of parallel uploads are not mixed
+            tqdm.tqdm.write(f'Processing file: {url}')
             if self.is_remote and self.checksum is None:
                 tempdir = os.path.join(os.getcwd(), '.zen')
-                if not os.path.isdir(tempdir):
-                    os.makedirs(tempdir)
+                os.makedirs(tempdir, exist_ok=True)
                 tempfile = os.path.join(tempdir, os.path.basename(self['filename']))
                 url = __utils__.download_file(url, tempfile)
             if self.checksum is None:
@@ -355,11 +376,13 @@ class LocalFile(BaseFile):
                         deposition.files.create(url)
                         break
                     except Exception as e:
-                        print(f"Attempt {retries + 1} failed:", e)
+                        tqdm.tqdm.write(f"Attempt {retries + 1} failed: {e}")
                         if retries < max_retries - 1:
-                            # Generate a random time delay between min_delay and max_delay seconds
-                            random_delay = random.randint(min_delay, max_delay)
-                            print(f"Retrying in {random_delay} seconds...")
+                            # Exponential backoff with jitter: the delay is drawn between min_delay 
+                            # and a cap that doubles at each attempt, bounded by max_delay seconds
+                            cap = min(max_delay, min_delay * 2 ** (retries + 1))
+                            random_delay = random.uniform(min_delay, cap)
+                            tqdm.tqdm.write(f"Retrying in {random_delay:.1f} seconds...")
                             time.sleep(random_delay)  # Wait for the random delay
                         else:
                             raise RuntimeError("Max retries exceeded")  
@@ -516,6 +539,8 @@ class ZenodoFile(BaseFile):
         >>> dep.discard()
     
     """
+    __slots__ = ('_deposition',)
+    
     def __init__(self, file: Dict[str,Any], deposition: Deposition) -> None:
         if not isinstance(file, dict):
             raise TypeError('Invalid `file` parameter. Expecting a `dict` but got a ' +
@@ -542,11 +567,8 @@ class ZenodoFile(BaseFile):
         if not os.path.isdir(dirname):
             raise ValueError(f"Invalid `dirname` parameter. Directory '{dirname}' is invalid.")
         dest_file = os.path.join(dirname, self['filename'])
-        # Support for draft files
-        url = self.url
-        if url.find('draft/files') > -1:
-            url = self._deposition.api.api.url_token(url)
-        __utils__.download_file(url, dest_file)
+        # The API session sends the token, so draft files can be downloaded as well
+        return self._deposition.api.api.download_file(self.url, dest_file)
     
     def refresh(self) -> Self:
         """Refresh the file data from Zenodo.
@@ -568,6 +590,8 @@ class ZenodoFile(BaseFile):
 
 
 class _BaseDataset:
+    __slots__ = ('_data', '_invalidated')
+    
     def __init__(self, data: Optional[Any]) -> None:
         self._data = data
         self._invalidated = False
@@ -585,6 +609,8 @@ class _BaseDataset:
 
 
 class _FileDataset(_BaseDataset):
+    __slots__ = ('_index',)
+    
     def __init__(self, files: Optional[List[Union[Dict[str,Any],str]]]=None) -> None:
         # Default
         if files is None:
@@ -595,7 +621,7 @@ class _FileDataset(_BaseDataset):
                             f'`{type(files)}` instead.')
         # Check duplication
         data = [self._new_file(file) for file in files]
-        if len(data) != len(set([file.filename for file in data])):
+        if len(data) != len({file.filename for file in data}):
             raise ValueError('Duplicated filenames in the file list.')
         # Initialize files
         super().__init__(data)
@@ -622,9 +648,17 @@ class _FileDataset(_BaseDataset):
     def _new_file(self, file: Union[Dict[str,Any],str]) -> BaseFile:
         return BaseFile(file)
     
-    def _for_each(self, fn_foreach: Callable[[BaseFile],None], progress: bool=True) -> None:
-        for file in tqdm.tqdm(self._data, disable=not progress or len(self._data) <= 1):
-            fn_foreach(file)
+    def _for_each(self, fn_foreach: Callable[[BaseFile],None], progress: bool=True, 
+                  max_workers: int=1) -> None:
+        disable = not progress or len(self._data) <= 1
+        if max_workers <= 1:
+            for file in tqdm.tqdm(self._data, disable=disable):
+                fn_foreach(file)
+            return
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for _ in tqdm.tqdm(executor.map(fn_foreach, self._data), total=len(self._data), 
+                               disable=disable):
+                pass
     
     def _filter(self, fn_filter: Optional[Callable[[BaseFile],bool]]=None) -> List[BaseFile]:
         # Check params
@@ -636,6 +670,8 @@ class _FileDataset(_BaseDataset):
 
 
 class _DatasetFile:
+    __slots__ = ('files', 'deposition')
+    
     @classmethod
     def from_file(cls, file: str) -> _DatasetFile:
         if file is None:
@@ -723,6 +759,8 @@ class LocalFiles(_FileDataset):
         >>> dep.discard()
     
     """
+    __slots__ = ('_file', '_placeholders')
+    
     @staticmethod
     def _expand(file: LocalFile, **kwargs) -> LocalFile:
         for k, v in kwargs.items():
@@ -862,7 +900,7 @@ class LocalFiles(_FileDataset):
                              'dataset before assigning a deposition.')
         dataset = _DatasetFile.from_file(self._file)
         if deposition is None:
-            api = Zenodo(url, token, headers)
+            api = _get_api(url, token, headers)
             if dataset.deposition is None:
                 if not create_if_not_exists:
                     raise ValueError('No deposition is linked with current dataset. Please, ' +
@@ -878,8 +916,10 @@ class LocalFiles(_FileDataset):
             dataset.save(self._file)
         else:
             if not isinstance(deposition, Deposition):
-                api = Zenodo(url, token, headers)
+                api = _get_api(url, token, headers)
                 deposition = api.depositions.retrieve(deposition)
+            else:
+                api = deposition.api
             if dataset.deposition is not None:
                 saved_deposition = api.depositions.retrieve(dataset.deposition)
                 if saved_deposition.id != deposition.id:
@@ -1015,10 +1055,11 @@ class LocalFiles(_FileDataset):
                 self._index[file.filename] = self._new_file(file)
                 self._data.append(self._index[file.filename])
         if remove_unmatched:
+            # Rebuild the list in a single pass instead of removing files one by one
             for file in self._data:
                 if not file.filename in other._index:
                     del self._index[file.filename]
-                    self._data.remove(file)
+            self._data[:] = [file for file in self._data if file.filename in self._index]
         return self
     
     def add(self, files: List[Union[Dict[str,Any],str]], template: Optional[str]=None) -> Self:
@@ -1203,7 +1244,8 @@ class LocalFiles(_FileDataset):
                 ('' if suffix is None else suffix)
         return self
     
-    def upload(self, deposition: Deposition, progress: bool=True, force: bool=False) -> None:
+    def upload(self, deposition: Deposition, progress: bool=True, force: bool=False, 
+               max_workers: int=4) -> None:
         """Upload files to a Zenodo deposition and update files' metadata.
         
         This method enables you to upload files to a Zenodo deposition, ensuring that their metadata 
@@ -1214,6 +1256,8 @@ class LocalFiles(_FileDataset):
             progress (bool=True): Show a progress bar?
             force (bool=False): Should all files be uploaded regardless they already been 
                 uploaded or not?
+            max_workers (int=4): The maximum number of files uploaded at the same time. Use `1` 
+                to upload the files one by one.
         
         Returns:
             None
@@ -1249,11 +1293,15 @@ class LocalFiles(_FileDataset):
                             f'{type(deposition)} instead.')
         def _upload(file: LocalFile) -> None:
             file.upload(deposition, force)
+        # The files are built and synchronized once, before they are shared by the uploads
+        deposition.files._revalidate()
         try:
-            self._for_each(_upload, progress)
+            self._for_each(_upload, progress, max_workers)
         finally:
             self.save()
-        deposition.refresh()
+        # Files are invalidated by any upload, otherwise the deposition is still up to date
+        if deposition.files._invalidated:
+            deposition.refresh()
     
     def summary(self, properties: Optional[List[str]]=None, **kwargs):
         """Summarizes the file properties of the current dataset
@@ -1298,9 +1346,9 @@ class LocalFiles(_FileDataset):
         if properties is None:
             properties = list(self.properties)
         def _min(values: List[Any]):
-            return min([v for v in values if v is not None and v != ''])
+            return min(v for v in values if v is not None and v != '')
         def _max(values: List[Any]):
-            return max([v for v in values if v is not None and v != ''])
+            return max(v for v in values if v is not None and v != '')
         if 'min' not in kwargs:
             kwargs['min'] = _min
         if 'max' not in kwargs:
@@ -1328,7 +1376,7 @@ class LocalFiles(_FileDataset):
     def storage_size(self) -> int:
         """Calculates the total data size of the files.
         """
-        return sum([file.filesize for file in self._data])
+        return sum(file.filesize for file in self._data)
     
     @property
     def placeholders(self) -> Set[str]:
@@ -1374,10 +1422,16 @@ class DepositionFiles(_FileDataset):
             (default is None).
     
     """
+    __slots__ = ('_deposition', '_lock')
+    
     def __init__(self, deposition: Deposition, files: Optional[List[Dict,str]]=None) -> None:
         self._deposition = deposition
         super().__init__(files)
         self._data: List[ZenodoFile] = self._data
+        if not hasattr(self, '_lock'):
+            # Guards the file list against parallel uploads. Reentrant, as `list()` rebuilds 
+            # the object by calling this method again
+            self._lock = threading.RLock()
     
     def __repr__(self) -> str:
         self._revalidate()
@@ -1392,11 +1446,21 @@ class DepositionFiles(_FileDataset):
     
     def _revalidate(self) -> None:
         if self._invalidated:
-            try:
-                self.list()
-                super()._revalidate()
-            except json.JSONDecodeError as e:
-                pass
+            with self._lock:
+                if not self._invalidated:
+                    return
+                try:
+                    self.list()
+                    super()._revalidate()
+                except json.JSONDecodeError as e:
+                    pass
+    
+    def invalidate(self) -> None:
+        """Flags the dataset as not synchronized.
+        """
+        # Waits for any listing in progress, which could miss the change
+        with self._lock:
+            super().invalidate()
     
     def list(self) -> Self:
         """Lists and refresh the file list of the Zenodo deposition. 
@@ -1408,15 +1472,17 @@ class DepositionFiles(_FileDataset):
             DepositionFiles: The list of files of the Zenodo deposition.
         
         """ 
-        self.__init__(self._deposition, self._deposition.api.api\
-            .list_deposition_files(self._deposition.id))
+        with self._lock:
+            self.__init__(self._deposition, self._deposition.api.api\
+                .list_deposition_files(self._deposition.id))
         return self
     
     def create(self, file: str, bucket_filename: Optional[str]=None) -> Self:
         """Uploads a file to the deposition on the Zenodo API. 
         
         Args: 
-            file (str): The local file path of the file to upload. 
+            file (str): The local file path of the file to upload, or the URL of a remote file. 
+                Remote files are streamed to the deposition without being saved locally. 
             bucket_filename (Optional[str]=None): The desired filename for the file in the 
                 deposition's bucket. 
         
@@ -1424,26 +1490,43 @@ class DepositionFiles(_FileDataset):
             DepositionFiles: The current object.
         
         """ 
-        tempfile = None
         if not os.path.isfile(file):
             if not file.startswith(__utils__.valid_schemas):
                 raise ValueError(f"Invalid `file` parameter. File '{file}' is invalid.")
         try:
-            if file.startswith(__utils__.valid_schemas):
-                tempdir = os.path.join(os.getcwd(), '.zen')
-                if not os.path.isdir(tempdir):
-                    os.makedirs(tempdir)
-                tempfile = os.path.join(tempdir, os.path.basename(file))
-                file = __utils__.download_file(file, tempfile)
-            try:
-                self._deposition.api.api.create_deposition_file(self._deposition.id, file, 
-                                                                bucket_filename)
-            except json.JSONDecodeError as e:
-                pass
+            self._deposition.api.api.create_deposition_file(self._deposition.id, file, 
+                                                            bucket_filename)
+        except json.JSONDecodeError as e:
+            pass
+        finally:
+            self.invalidate()
+    
+    def create_many(self, files: List[str], max_workers: int=8) -> Self:
+        """Uploads several files to the deposition on the Zenodo API at the same time. 
+        
+        The deposition's bucket is looked up once, and the files are uploaded in parallel. Each 
+        file is stored under its base name. Remote files are streamed to the deposition without 
+        being saved locally. 
+        
+        Args: 
+            files (List[str]): The local file paths (or URLs) of the files to upload. 
+            max_workers (int=8): The maximum number of files uploaded at the same time. 
+        
+        Returns: 
+            DepositionFiles: The current object.
+        
+        """ 
+        for file in files:
+            if not os.path.isfile(file) and not file.startswith(__utils__.valid_schemas):
+                raise ValueError(f"Invalid `files` parameter. File '{file}' is invalid.")
+        try:
+            self._deposition.api.api.create_deposition_files(self._deposition.id, files, 
+                                                             max_workers)
+        except json.JSONDecodeError as e:
+            pass
         finally:
-            if tempfile is not None:
-                os.remove(tempfile)
             self.invalidate()
+        return self
     
     def delete(self, file: ZenodoFile) -> None:
         """Deletes a file of the Zenodo deposition. 
@@ -1475,7 +1558,7 @@ class DepositionFiles(_FileDataset):
     def storage_size(self) -> int:
         """Calculate the total data size of the files.
         """
-        return sum([file.filesize for file in self._data])
+        return sum(file.filesize for file in self._data)
 
 
 class Deposition(_BaseDataset):
@@ -1518,35 +1601,37 @@ class Deposition(_BaseDataset):
         >>> dep.discard()
     
     """ 
+    __slots__ = ('_api', '_files')
+    
     def __init__(self, api: Zenodo, data: Dict[str,Any]) -> None: # type: ignore
+        try:
+            data['id'], data['files']
+        except KeyError as e:
+            raise ValueError(f"Invalid `data` parameter. Value must have '{e.args[0]}' key.")
         self._api = api
-        if 'id' not in data:
-            raise ValueError(f"Invalid `data` parameter. Value must have 'id' key.")
-        if 'files' not in data:
-            raise ValueError(f"Invalid `data` parameter. Value must have 'files' key.")
         super().__init__(data)
-        self._data: Dict[str,Any] = data
-        self._files = DepositionFiles(self, data['files'])
+        # The files are wrapped on first access
+        self._files: Optional[DepositionFiles] = None
     
     def __repr__(self) -> str:
         info = dict(id=self._data['id'], title=self._data['title'], state=self._data['state'])
         return f"<Deposition: {info}>"
     
     def __len__(self):
-        return len(self._files)
+        return len(self.files)
     
     def __getitem__(self, key: int) -> BaseFile:
-        return self._files[key]
+        return self.files[key]
     
     def __iter__(self) -> Iterator[BaseFile]:
-        for file in self._files:
+        for file in self.files:
             yield file
     
     def __contains__(self, item: BaseFile):
-        return item.filename in self._files._index and \
-            (self._files._index[item.filename].checksum is None or \
+        return item.filename in self.files._index and \
+            (self.files._index[item.filename].checksum is None or \
             (item.checksum is not None and \
-                item.checksum == self._files._index[item.filename].checksum))
+                item.checksum == self.files._index[item.filename].checksum))
     
     def refresh(self) -> Self:
         """Refresh the Deposition Data from Zenodo.
@@ -1588,7 +1673,7 @@ class Deposition(_BaseDataset):
         try:
             self.__init__(self._api, self._api.api.update_deposition(self._data['id'], metadata))
         except json.JSONDecodeError as e:
-            self._files.invalidate()
+            self.files.invalidate()
         return self
     
     def delete(self) -> None:
@@ -1609,7 +1694,7 @@ class Deposition(_BaseDataset):
         try:
             self.__init__(self._api, self._api.api.publish_deposition(self._data['id']))
         except json.JSONDecodeError as e:
-            self._files.invalidate()
+            self.files.invalidate()
         return self
     
     def edit(self) -> Self:
@@ -1622,7 +1707,7 @@ class Deposition(_BaseDataset):
         try:
             self.__init__(self._api, self._api.api.edit_deposition(self._data['id']))
         except json.JSONDecodeError as e:
-            self._files.invalidate()
+            self.files.invalidate()
         return self
     
     def discard(self) -> Self:
@@ -1635,7 +1720,7 @@ class Deposition(_BaseDataset):
         try:
             self.__init__(self._api, self._api.api.discard_deposition(self._data['id']))
         except json.JSONDecodeError as e:
-            self._files.invalidate()
+            self.files.invalidate()
         return self
     
     def new_version(self) -> Self:
@@ -1648,7 +1733,7 @@ class Deposition(_BaseDataset):
         try:
             self.__init__(self._api, self._api.api.new_version_deposition(self._data['id']))
         except json.JSONDecodeError as e:
-            self._files.invalidate()
+            self.files.invalidate()
         return self
     
     @property
@@ -1667,26 +1752,25 @@ class Deposition(_BaseDataset):
     def doi(self) -> str:
         """The DOI of the deposition, or None if not available.
         """ 
-        if 'doi' in self._data and self._data['doi'] != '':
-            return self._data['doi']
-        if 'prereserve_doi' in self._data['metadata']:
-            return self._data['metadata']['prereserve_doi']['doi']
+        doi = self._data.get('doi')
+        if doi:
+            return doi
+        prereserve_doi = self._data['metadata'].get('prereserve_doi')
+        if prereserve_doi is not None:
+            return prereserve_doi['doi']
         return None
     
     @property
     def concept_id(self) -> str:
         """The concept ID of the deposition, or None if not available.
         """ 
-        if 'conceptrecid' in self._data and self._data['conceptrecid'] != '':
-            return self._data['conceptrecid']
+        return self._data.get('conceptrecid') or None
     
     @property
     def title(self) -> str:
         """The title of the deposition.
         """ 
-        if 'title' in self._data:
-            return self._data['title']
-        return ''
+        return self._data.get('title', '')
     
     @property
     def is_editing(self) -> bool:
@@ -1704,6 +1788,8 @@ class Deposition(_BaseDataset):
     def files(self) -> DepositionFiles:
         """The files of the deposition.
         """ 
+        if self._files is None:
+            self._files = DepositionFiles(self, self._data['files'])
         return self._files
     
     @property
@@ -1128,8 +1128,11 @@ class Metadata(_MetaBaseObject):
         missing_placeholders = placeholders - set(replacements.keys())
         if missing_placeholders:
             raise ValueError(f"Missing replacements for placeholders: {', '.join(missing_placeholders)}")
-        data = __utils__.replace(dict(**deepcopy(self.data)), replacements, Placeholder.schema)
-        return data
+        data = deepcopy(self.data)
+        # Without placeholders nor replacements there is nothing to replace
+        if not placeholders and not replacements:
+            return data
+        return __utils__.replace(data, replacements, Placeholder.schema)
     
     @property
     def placeholders(self) -> Set[str]:
@@ -1191,7 +1194,7 @@ class Metadata(_MetaBaseObject):
         """
         return self.data['publication_type']
     
-    @upload_type.setter
+    @publication_type.setter
     def publication_type(self, value: str) -> None:
         _check_instance(value, str)
         if value not in Publication.publication_types:
@@ -1214,7 +1217,7 @@ class Metadata(_MetaBaseObject):
         """
         return self.data['image_type']
     
-    @upload_type.setter
+    @image_type.setter
     def image_type(self, value: str) -> None:
         _check_instance(value, str)
         if value not in Image.image_types:
@@ -34,14 +34,28 @@ from datetime import datetime
 from dateutil.relativedelta import relativedelta
 import hashlib
 import json
+import math
 import os
 import re
 import requests
+import shutil
+import tempfile
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# The process umask, read once at import as it can only be read by setting it
+_UMASK = os.umask(0)
+os.umask(_UMASK)
 
 
 def load_json(file: str) -> Any:
     """
     Load JSON data from a local file.
+    
+    The file is parsed with `orjson`, if installed, or with the standard `json` module. Files 
+    `orjson` rejects, e.g. with `NaN` or `Infinity` values, are parsed with the `json` module.
 
     Args:
         file (str): The path to the JSON file.
@@ -50,12 +64,39 @@ def load_json(file: str) -> Any:
         Any: Any value stored in a JSON file.
     
     """
+    if orjson is not None:
+        with open(file, 'rb') as file:
+            content = file.read()
+        try:
+            return orjson.loads(content)
+        except orjson.JSONDecodeError:
+            return json.loads(content)
     with open(file, 'r') as file:
         return json.load(file)
 
+def _has_non_finite(data: Any) -> bool:
+    # Walks the data looking for float values `orjson` would write as `null`
+    stack = [data]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, float):
+            if not math.isfinite(value):
+                return True
+        elif isinstance(value, dict):
+            stack.extend(value.values())
+        elif isinstance(value, (list, tuple)):
+            stack.extend(value)
+    return False
+
 def save_json(data: Any, file: str) -> None:
     """
     Save dictionary data as JSON to a local file.
+    
+    The data is serialized with `orjson`, if installed, or with the standard `json` module. 
+    Both produce JSON indented by two spaces. Data with `NaN` or `Infinity` values is always 
+    serialized with the `json` module, as `orjson` would write them as `null`. The content is 
+    written to a unique temporary file in the same directory that replaces the target file at 
+    once, so the target is never left partially written, even by concurrent writers.
 
     Args:
         data (dict): Any data to be saved into a JSON file.
@@ -66,14 +107,49 @@ def save_json(data: Any, file: str) -> None:
     
     """
     dirname = os.path.dirname(file)
-    if not os.path.isdir(dirname):
+    if dirname and not os.path.isdir(dirname):
         os.mkdir(dirname)
-    with open(file, 'w') as file:
-        json.dump(data, file, indent=4)
+    content = None
+    if orjson is not None and not _has_non_finite(data):
+        content = orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    fd, tmp_file = tempfile.mkstemp(dir=dirname or os.curdir, 
+                                    prefix=os.path.basename(file) + '.', suffix='.tmp')
+    try:
+        if content is not None:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(content)
+        else:
+            # Stream the encoded chunks instead of building the whole document in memory
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(data, f, indent=2)
+        # Temporary files are private, give the target the usual permissions
+        os.chmod(tmp_file, 0o666 & ~_UMASK)
+        os.replace(tmp_file, file)
+    except BaseException:
+        if os.path.exists(tmp_file):
+            os.remove(tmp_file)
+        raise
 
 
 valid_schemas = ('http://', 'https://')
 
+_session: Optional[requests.Session] = None
+
+def http_session() -> requests.Session:
+    """Returns the session used to access remote files.
+    
+    The same session is shared by all functions that access files by URL, so that connections 
+    to the same host are kept alive and reused.
+    
+    Returns:
+        requests.Session: The shared session.
+    
+    """
+    global _session
+    if _session is None:
+        _session = requests.Session()
+    return _session
+
 def download_file(url: str, dest_file: str) -> str:
     """Download a file from a URL and save it locally.
     
@@ -101,12 +177,12 @@ def download_file(url: str, dest_file: str) -> str:
     """
     if not url.startswith(valid_schemas):
         raise ValueError(f"Invalid `url` parameter. URL '{url}' is invalid.")
-    response = requests.get(url, stream=True)
+    response = http_session().get(url, stream=True)
     response.raise_for_status()
+    # Copy the raw stream in large blocks, letting urllib3 undo any content encoding
+    response.raw.decode_content = True
     with open(dest_file, 'wb') as file:
-        for chunk in response.iter_content(chunk_size=4096):
-            if chunk:
-                file.write(chunk)
+        shutil.copyfileobj(response.raw, file, 1 << 20)
     return dest_file
 
 def checksum(filename: str, algorithm: str='md5') -> str:
@@ -146,12 +222,16 @@ def checksum(filename: str, algorithm: str='md5') -> str:
     hash_object = hashlib.new(algorithm)
     if os.path.isfile(filename):
         with open(filename, 'rb') as file:
-            for chunk in iter(lambda: file.read(4096), b''):
+            # Python 3.11+ hashes the file in C, reusing a single buffer for all reads
+            if hasattr(hashlib, 'file_digest'):
+                return hashlib.file_digest(file, algorithm).hexdigest()
+            # Large blocks keep the number of reads low, and hashlib releases the GIL while hashing
+            for chunk in iter(lambda: file.read(1 << 20), b''):
                 hash_object.update(chunk)
     if filename.startswith(valid_schemas):
-        response = requests.get(filename, stream=True)
+        response = http_session().get(filename, stream=True)
         response.raise_for_status()
-        for chunk in response.iter_content(chunk_size=4096):
+        for chunk in response.iter_content(chunk_size=1 << 20):
             if chunk:
                 hash_object.update(chunk)
     return hash_object.hexdigest()
@@ -254,8 +334,10 @@ def replace(obj: Any, replacements: Dict[str,Any], schema: Optional[str]='zen:')
 
     """
     if isinstance(obj, str):
-        for placeholder, value in replacements.items():
-            obj = obj.replace(f"{{{placeholder}}}", str(value))
+        # Most strings have no placeholders at all
+        if '{' in obj:
+            for placeholder, value in replacements.items():
+                obj = obj.replace(f"{{{placeholder}}}", str(value))
     elif isinstance(obj, dict):
         # Treat also dictionary placeholders
         if schema is not None and '$ref' in obj and isinstance(obj['$ref'], str):